@@ -7,6 +7,7 @@ A macOS system monitoring and startup management tool.
 import sys
 import os
 import json
+import functools
 import logging
 from pathlib import Path
 
@@ -39,6 +40,9 @@ class MainWindow(QMainWindow):
     def __init__(self):
         """Initialize main window."""
         super().__init__()
+
+        # Directory holding the app config; None means the user's home
+        self._config_home = None
         
         # Initialize managers (process_monitor first, then passed to startup_manager)
         self.process_monitor = ProcessMonitor()
@@ -107,18 +111,22 @@ class MainWindow(QMainWindow):
             if not guide.should_show_again():
                 self._save_guide_preference()
 
-    def _has_seen_guide(self) -> bool:
-        """Check if user has already seen the startup guide."""
+    @functools.cached_property
+    def _config(self) -> dict:
+        """Parsed config file, read from disk at most once until it is saved."""
         config_path = self._get_config_path()
         if not config_path.exists():
-            return False
+            return {}
 
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                return config.get('startup_guide_shown', False)
+            config = json.loads(config_path.read_text())
         except Exception:
-            return False
+            return {}
+        return config if isinstance(config, dict) else {}
+
+    def _has_seen_guide(self) -> bool:
+        """Check if user has already seen the startup guide."""
+        return self._config.get('startup_guide_shown', False)
 
     def _save_guide_preference(self):
         """Save that user has seen the guide."""
@@ -142,11 +150,14 @@ class MainWindow(QMainWindow):
                 json.dump(config, f, indent=2)
         except Exception as e:
             logger.warning("Could not save guide preference: %s", e)
+        finally:
+            # Re-read the config on next access
+            self.__dict__.pop('_config', None)
 
     def _get_config_path(self) -> Path:
         """Get path to config file."""
-        # Use user's home directory
-        home = Path.home()
+        # Use user's home directory unless another one was configured
+        home = self._config_home or Path.home()
         config_dir = home / '.mac-health-analyzer'
         return config_dir / 'config.json'
 
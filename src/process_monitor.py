@@ -3,9 +3,11 @@ Process Monitor for macOS.
 Handles real-time monitoring of running processes and system resources.
 """
 
+import heapq
 import logging
 import psutil
 import time
+from operator import itemgetter
 from typing import List, Dict, Optional
 from PyQt6.QtCore import QObject, QThread, pyqtSignal, QMutex, QMutexLocker
 
@@ -17,6 +19,9 @@ from utils.helpers import (
     bytes_to_human_readable
 )
 
+# Owners whose processes are hidden unless system processes are requested
+SYSTEM_USERNAMES = frozenset({'root', '_windowserver', 'nobody'})
+
 
 class ProcessWorker(QThread):
     """
@@ -97,8 +102,8 @@ class ProcessWorker(QThread):
                     name = proc.name()
                     username = proc.username()
                     
-                    # Filter system processes if needed
-                    if not include_system and username in ['root', '_windowserver', 'nobody']:
+                    # Filter system processes before building their dict
+                    if not include_system and username in SYSTEM_USERNAMES:
                         continue
                         
                     memory_full = proc.memory_info()
@@ -163,6 +168,10 @@ class ProcessMonitor(QObject):
             'cpu_info': {},
             'process_count': 0
         }
+
+        # Lowercased names for search, rebuilt only when the process list is replaced
+        self._indexed_processes = None
+        self._search_index = []
         
         self._worker.start()
         
@@ -214,21 +223,12 @@ class ProcessMonitor(QObject):
     
     def get_top_memory_processes(self, n: int = 10) -> List[Dict[str, any]]:
         """Get top N processes by memory usage."""
-        sorted_processes = sorted(
-            self._latest_data['processes'],
-            key=lambda x: x['memory_mb'],
-            reverse=True
-        )
-        return sorted_processes[:n]
+        # Partial selection avoids sorting the full process list for a small n
+        return heapq.nlargest(n, self._latest_data['processes'], key=itemgetter('memory_mb'))
     
     def get_top_cpu_processes(self, n: int = 10) -> List[Dict[str, any]]:
         """Get top N processes by CPU usage."""
-        sorted_processes = sorted(
-            self._latest_data['processes'],
-            key=lambda x: x['cpu_percent'],
-            reverse=True
-        )
-        return sorted_processes[:n]
+        return heapq.nlargest(n, self._latest_data['processes'], key=itemgetter('cpu_percent'))
 
     def get_top_processes(self, n: int = 10) -> Dict[str, List[Dict[str, any]]]:
         """
@@ -236,32 +236,26 @@ class ProcessMonitor(QObject):
         """
         processes = self._latest_data['processes']
         
-        # Sort by CPU
-        cpu_sorted = sorted(
-            processes,
-            key=lambda x: x['cpu_percent'],
-            reverse=True
-        )
-
-        # Sort by memory
-        memory_sorted = sorted(
-            processes,
-            key=lambda x: x['memory_mb'],
-            reverse=True
-        )
-
         return {
-            'cpu': cpu_sorted[:n],
-            'memory': memory_sorted[:n]
+            'cpu': heapq.nlargest(n, processes, key=itemgetter('cpu_percent')),
+            'memory': heapq.nlargest(n, processes, key=itemgetter('memory_mb'))
         }
     
     def search_processes(self, query: str) -> List[Dict[str, any]]:
         """Search processes by name."""
         query_lower = query.lower()
         return [
-            proc for proc in self._latest_data['processes']
-            if query_lower in proc['name'].lower()
+            proc for name_lower, proc in self._get_search_index()
+            if query_lower in name_lower
         ]
+
+    def _get_search_index(self) -> List[tuple]:
+        """Get (name_lower, process) tuples for the latest process list."""
+        processes = self._latest_data['processes']
+        if self._indexed_processes is not processes:
+            self._search_index = [(proc['name'].lower(), proc) for proc in processes]
+            self._indexed_processes = processes
+        return self._search_index
     
     def get_process_by_pid(self, pid: int) -> Optional[Dict[str, any]]:
         """Get process information by PID."""
@@ -179,6 +179,13 @@ class StartupManager(QObject):
         self._launchctl_cache_ts = 0.0
         self._process_monitor = process_monitor
 
+        # Derived views of all_items, rebuilt only when all_items is reassigned
+        self._indexed_items = None
+        self._search_index = []
+        self._enabled_items = []
+        self._disabled_items = []
+        self._items_by_type = {}
+
         # Thread pool for async scans
         self._thread_pool = QThreadPool()
         self._signals = StartupManagerSignals()
@@ -194,10 +201,11 @@ class StartupManager(QObject):
         Refresh all startup items asynchronously.
         No longer performs process matching since CPU/Memory data is not displayed in startup tab.
         """
-        now = time.time()
+        # Monotonic clock: unaffected by wall-clock changes, read once per refresh
+        now = time.monotonic()
 
-        # Reset cache if stale (> 5 seconds)
-        if now - self._launchctl_cache_ts > 5:
+        # Reset cache if stale (more than 5 seconds old)
+        if not self._is_launchctl_cache_fresh(now):
             self._launchctl_cache = set()
             self._launchctl_cache_ts = now
 
@@ -205,6 +213,18 @@ class StartupManager(QObject):
         worker = StartupScanWorker(self._signals, self._launchctl_cache, None)
         self._thread_pool.start(worker)
         
+    def _is_launchctl_cache_fresh(self, now: float) -> bool:
+        """
+        Check whether the cached launchctl labels are still usable.
+
+        Args:
+            now: Current time.monotonic() value
+
+        Returns:
+            True if the cache is at most 5 seconds old
+        """
+        return now - self._launchctl_cache_ts <= 5
+
     @pyqtSlot(list, set)
     def _on_scan_finished(self, items, launchctl_cache):
         """Handle completion of background scan."""
@@ -266,7 +286,8 @@ class StartupManager(QObject):
         Returns:
             List of enabled items
         """
-        return [item for item in self.all_items if item.get('enabled', True)]
+        self._update_indexes()
+        return list(self._enabled_items)
     
     def get_disabled_items(self) -> List[Dict[str, any]]:
         """
@@ -275,7 +296,8 @@ class StartupManager(QObject):
         Returns:
             List of disabled items
         """
-        return [item for item in self.all_items if not item.get('enabled', True)]
+        self._update_indexes()
+        return list(self._disabled_items)
     
     def disable_item(self, item: Dict[str, any]) -> bool:
         """
@@ -330,7 +352,8 @@ class StartupManager(QObject):
         Returns:
             Number of enabled startup items
         """
-        return len(self.get_enabled_items())
+        self._update_indexes()
+        return len(self._enabled_items)
     
     def get_disabled_count(self) -> int:
         """
@@ -339,7 +362,8 @@ class StartupManager(QObject):
         Returns:
             Number of disabled startup items
         """
-        return len(self.get_disabled_items())
+        self._update_indexes()
+        return len(self._disabled_items)
     
     def search_items(self, query: str) -> List[Dict[str, any]]:
         """
@@ -353,10 +377,51 @@ class StartupManager(QObject):
         """
         query_lower = query.lower()
         return [
-            item for item in self.all_items
-            if query_lower in item.get('name', '').lower()
-            or query_lower in item.get('label', '').lower()
+            item for name_lower, label_lower, item in self._get_search_index()
+            if query_lower in name_lower or query_lower in label_lower
         ]
+
+    def _get_search_index(self) -> List[tuple]:
+        """
+        Get (name_lower, label_lower, item) tuples for the current items.
+
+        Returns:
+            List of search index tuples
+        """
+        self._update_indexes()
+        return self._search_index
+
+    def _update_indexes(self):
+        """
+        Rebuild the search index and enabled/disabled/type buckets.
+
+        Only does work when all_items has been replaced since the last build,
+        so the getters don't re-scan every item on each call. Changes made to
+        all_items in place are not detected; reassign all_items instead.
+        Getters return copies, so callers can't alter the cached buckets.
+        """
+        if self._indexed_items is self.all_items:
+            return
+
+        search_index = []
+        enabled_items = []
+        disabled_items = []
+        items_by_type = {}
+        for item in self.all_items:
+            search_index.append(
+                (item.get('name', '').lower(), item.get('label', '').lower(), item)
+            )
+            if item.get('enabled', True):
+                enabled_items.append(item)
+            else:
+                disabled_items.append(item)
+            items_by_type.setdefault(item.get('type'), []).append(item)
+
+        self._search_index = search_index
+        self._enabled_items = enabled_items
+        self._disabled_items = disabled_items
+        self._items_by_type = items_by_type
+        self._indexed_items = self.all_items
     
     def filter_by_type(self, item_type: str) -> List[Dict[str, any]]:
         """
@@ -368,7 +433,8 @@ class StartupManager(QObject):
         Returns:
             List of matching items
         """
-        return [item for item in self.all_items if item.get('type') == item_type]
+        self._update_indexes()
+        return list(self._items_by_type.get(item_type, ()))
     
     def get_summary(self) -> Dict[str, any]:
         """
@@ -377,10 +443,12 @@ class StartupManager(QObject):
         Returns:
             Dict with summary information
         """
+        # Counts come straight from the cached buckets, without copying them
+        self._update_indexes()
         return {
-            'total': self.get_item_count(),
-            'enabled': self.get_enabled_count(),
-            'disabled': self.get_disabled_count(),
+            'total': len(self.all_items),
+            'enabled': len(self._enabled_items),
+            'disabled': len(self._disabled_items),
             'login_items': len(self.login_items),
             'launch_agents': len(self.launch_agents),
             'launch_daemons': len(self.launch_daemons),
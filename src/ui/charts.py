@@ -4,10 +4,12 @@ Sophisticated visualizations with expert-level polish and depth.
 Designed to feel hand-crafted by a seasoned data visualization professional.
 """
 
+from bisect import bisect_right
 from collections import deque
+import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize, QEvent
 from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QLinearGradient, QConicalGradient
 from .styles import COLORS
 
@@ -29,6 +31,8 @@ class RealtimeLineChart(QWidget):
         self.title = title
         self.max_points = max_points
         self.data_points = deque(maxlen=max_points)
+        # Fixed x positions; update_data slices a view instead of rebuilding them
+        self._x_data = np.arange(max_points, dtype=np.float64)
         self.current_value_label = None
 
         self.setup_ui()
@@ -127,8 +131,9 @@ class RealtimeLineChart(QWidget):
             self.current_value_label.setText(f"{value:.1f}%")
 
         # Update the line
-        x_data = list(range(len(self.data_points)))
-        y_data = list(self.data_points)
+        count = len(self.data_points)
+        x_data = self._x_data[:count]
+        y_data = np.fromiter(self.data_points, dtype=np.float64, count=count)
 
         self.data_line.setData(x_data, y_data)
         self.fill_curve.setData(x_data, y_data)
@@ -155,6 +160,7 @@ class CircularGauge(QWidget):
         self.value = 0.0
         self.max_value = 100.0
         self.fixed_color = fixed_color
+        self._fonts = None  # (value, unit, title) fonts, built on first paint
 
         self.setMinimumSize(280, 300)
 
@@ -166,10 +172,36 @@ class CircularGauge(QWidget):
             value: Current value
             max_value: Maximum value
         """
+        # Skip the repaint when a refresh tick reports the same reading
+        if value == self.value and max_value == self.max_value:
+            return
+
         self.value = value
         self.max_value = max_value
         self.update()
 
+    def changeEvent(self, event):
+        """Drop cached fonts when the widget font changes."""
+        if event.type() == QEvent.Type.FontChange:
+            self._fonts = None
+        super().changeEvent(event)
+
+    def _build_fonts(self):
+        """Build the value, unit and title fonts from the widget font."""
+        value_font = self.font()
+        value_font.setPointSize(32)  # Larger font for bigger circles
+        value_font.setBold(True)
+
+        unit_font = self.font()
+        unit_font.setPointSize(14)  # Slightly larger unit text
+        unit_font.setBold(False)
+
+        title_font = self.font()
+        title_font.setPointSize(16)  # Larger title for bigger circles
+        title_font.setBold(True)
+
+        return value_font, unit_font, title_font
+
     def get_color_for_value(self) -> str:
         """Get color based on value percentage."""
         # Use fixed color if set
@@ -233,14 +265,14 @@ class CircularGauge(QWidget):
         painter.drawEllipse(center_x - center_radius, center_y - center_radius,
                            center_radius * 2, center_radius * 2)
 
+        if self._fonts is None:
+            self._fonts = self._build_fonts()
+        value_font, unit_font, title_font = self._fonts
+
         # Draw value text
         painter.setPen(QColor(color))
-        painter.setFont(self.font())
 
         # Value
-        value_font = painter.font()
-        value_font.setPointSize(32)  # Larger font for bigger circles
-        value_font.setBold(True)
         painter.setFont(value_font)
 
         value_text = f"{self.value:.1f}" if isinstance(self.value, float) else str(self.value)
@@ -250,9 +282,6 @@ class CircularGauge(QWidget):
                         value_text)
 
         # Unit
-        unit_font = painter.font()
-        unit_font.setPointSize(14)  # Slightly larger unit text
-        unit_font.setBold(False)
         painter.setFont(unit_font)
         painter.setPen(QColor(COLORS['text_secondary']))
 
@@ -262,9 +291,6 @@ class CircularGauge(QWidget):
                         self.unit)
 
         # Draw title at top
-        title_font = painter.font()
-        title_font.setPointSize(16)  # Larger title for bigger circles
-        title_font.setBold(True)
         painter.setFont(title_font)
         painter.setPen(QColor(COLORS['text_primary']))
 
@@ -330,11 +356,19 @@ class BarChart(QWidget):
 
     clicked = pyqtSignal(dict)  # Emit the data entry for the double-clicked bar
 
+    BAR_HEIGHT = 25
+    BAR_SPACING = 8
+    BAR_LEFT = 10  # Left edge of the clickable area (label column)
+
     def __init__(self, title: str = "Processes", parent=None):
         super().__init__(parent)
         self.title = title
         self.data = []  # Normalized list of dict entries
-        self.bar_rects = []  # Store bar rectangles for click detection
+        self._bar_levels = []  # (fill fraction, color) per entry, computed in set_data
+        # Click detection: painted bar tops (ascending), their entries, hit-area width
+        self._bar_tops = []
+        self._bar_entries = []
+        self._bar_hit_width = 0
 
         self.setMinimumSize(300, 200)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -371,6 +405,21 @@ class BarChart(QWidget):
                 })
 
         self.data = normalized
+
+        # Fill fraction and color only change with the data, not on every repaint
+        bar_levels = []
+        for entry in normalized:
+            max_value = entry['max']
+            percent = (entry['value'] / max_value) if max_value > 0 else 0
+            if percent < 0.5:
+                color = COLORS['sage']
+            elif percent < 0.8:
+                color = COLORS['clay']
+            else:
+                color = COLORS['terracotta']
+            bar_levels.append((percent, color))
+        self._bar_levels = bar_levels
+
         self.update()
 
     def paintEvent(self, event):
@@ -400,36 +449,28 @@ class BarChart(QWidget):
         painter.drawText(width - 280, 20, "Double-click to learn more")
 
         # Draw bars
-        bar_height = 25
-        bar_spacing = 8
+        bar_height = self.BAR_HEIGHT
+        bar_spacing = self.BAR_SPACING
         start_y = 40
         max_bar_width = width - 120
 
         painter.setFont(self.font())
 
-        # Clear previous bar rectangles
-        self.bar_rects = []
+        # Reset click detection geometry
+        self._bar_tops = []
+        self._bar_entries = []
+        self._bar_hit_width = max_bar_width + 80
 
         metrics = painter.fontMetrics()
 
-        for i, entry in enumerate(self.data):
-            label = entry.get('label', '')
-            value = entry.get('value', 0)
-            max_value = entry.get('max', 100)
+        for i, (entry, (percent, color)) in enumerate(zip(self.data, self._bar_levels)):
+            label = entry['label']
+            value = entry['value']
             y = start_y + i * (bar_height + bar_spacing)
 
             # Calculate bar width
-            percent = (value / max_value) if max_value > 0 else 0
             bar_width = int(percent * max_bar_width)
 
-            # Color based on percentage
-            if percent < 0.5:
-                color = COLORS['sage']
-            elif percent < 0.8:
-                color = COLORS['clay']
-            else:
-                color = COLORS['terracotta']
-
             # Draw background bar
             painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(QColor(COLORS['border']))
@@ -444,15 +485,14 @@ class BarChart(QWidget):
                 painter.setBrush(gradient)
                 painter.drawRoundedRect(80, y, bar_width, bar_height, 4, 4)
 
-            # Store bar rectangle for click detection
-            from PyQt6.QtCore import QRect
-            bar_rect = QRect(10, y, max_bar_width + 80, bar_height)
-            self.bar_rects.append((bar_rect, entry))
+            # Store bar position for click detection
+            self._bar_tops.append(y)
+            self._bar_entries.append(entry)
 
             # Draw label
             painter.setPen(QColor(COLORS['text_primary']))
             display_label = metrics.elidedText(label, Qt.TextElideMode.ElideRight, 70)
-            painter.drawText(10, y + 17, display_label)
+            painter.drawText(self.BAR_LEFT, y + 17, display_label)
 
             # Draw value with unit
             painter.setPen(QColor(color))
@@ -461,23 +501,27 @@ class BarChart(QWidget):
 
     def mouseDoubleClickEvent(self, event):
         """Handle double-click on bars."""
-        from PyQt6.QtCore import QPoint
         click_pos = event.pos()
-
-        # Check if click is on any bar
-        for bar_rect, entry in self.bar_rects:
-            if bar_rect.contains(click_pos):
-                # Emit signal with the entire entry (label, value, payload)
-                self.clicked.emit(entry)
-                return
+        x = click_pos.x()
+        y = click_pos.y()
+
+        # Bars are stacked top to bottom, so the only candidate is the last
+        # bar starting at or above the click
+        index = bisect_right(self._bar_tops, y) - 1
+        if (
+            index >= 0
+            and y < self._bar_tops[index] + self.BAR_HEIGHT
+            and self.BAR_LEFT <= x < self.BAR_LEFT + self._bar_hit_width
+        ):
+            # Emit signal with the entire entry (label, value, payload)
+            self.clicked.emit(self._bar_entries[index])
+            return
 
         super().mouseDoubleClickEvent(event)
 
     def sizeHint(self):
         """Suggest size based on data."""
-        bar_height = 25
-        bar_spacing = 8
         title_height = 40
 
-        height = title_height + len(self.data) * (bar_height + bar_spacing)
+        height = title_height + len(self.data) * (self.BAR_HEIGHT + self.BAR_SPACING)
         return self.minimumSize().expandedTo(QSize(300, height))
@@ -244,8 +244,9 @@ class ProcessesTab(QWidget):
             processes: List of process dicts
         """
         try:
-            # Block signals during update for better performance
+            # Block signals and repaints during update for better performance
             self.table.blockSignals(True)
+            self.table.setUpdatesEnabled(False)
             
             # Remember selection
             selected_pids = {
@@ -337,6 +338,9 @@ class ProcessesTab(QWidget):
             logger.error("Error populating process table: %s", e)
             self.table.setSortingEnabled(True)
             self.table.blockSignals(False)
+        finally:
+            # Repaint once with all rows in place
+            self.table.setUpdatesEnabled(True)
     
     def get_color_for_percent(self, percent: float):
         """
@@ -16,6 +16,16 @@ from ui.styles import COLORS
 from ui.startup_detail_dialog import StartupDetailDialog
 
 
+# Filter combo entry -> predicate an item must satisfy ("All Items" has none)
+_FILTER_PREDICATES = {
+    "Login Items": lambda item: item['type'] == 'Login Item',
+    "Launch Agents": lambda item: item['type'] == 'Launch Agent',
+    "Launch Daemons": lambda item: item['type'] == 'Launch Daemon',
+    "Enabled Only": lambda item: item.get('enabled', True),
+    "Disabled Only": lambda item: not item.get('enabled', True),
+}
+
+
 class StartupTab(QWidget):
     """
     Tab for managing startup items.
@@ -220,28 +230,18 @@ class StartupTab(QWidget):
         filter_type = self.filter_combo.currentText()
         search_query = self.search_bar.text().lower()
         
-        # Get filtered items
-        filtered_items = self.current_items.copy()
-        
-        # Apply type filter
-        if filter_type == "Login Items":
-            filtered_items = [item for item in filtered_items if item['type'] == 'Login Item']
-        elif filter_type == "Launch Agents":
-            filtered_items = [item for item in filtered_items if item['type'] == 'Launch Agent']
-        elif filter_type == "Launch Daemons":
-            filtered_items = [item for item in filtered_items if item['type'] == 'Launch Daemon']
-        elif filter_type == "Enabled Only":
-            filtered_items = [item for item in filtered_items if item.get('enabled', True)]
-        elif filter_type == "Disabled Only":
-            filtered_items = [item for item in filtered_items if not item.get('enabled', True)]
-        
-        # Apply search filter
-        if search_query:
-            filtered_items = [
-                item for item in filtered_items
-                if search_query in item['name'].lower()
+        matches_filter = _FILTER_PREDICATES.get(filter_type)
+
+        # Apply type and search filters in a single pass
+        filtered_items = [
+            item for item in self.current_items
+            if (matches_filter is None or matches_filter(item))
+            and (
+                not search_query
+                or search_query in item['name'].lower()
                 or search_query in item.get('label', '').lower()
-            ]
+            )
+        ]
         
         self.populate_table(filtered_items)
     
@@ -259,34 +259,42 @@ class StartupTab(QWidget):
         was_sorting_enabled = self.table.isSortingEnabled()
 
         self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(items))
 
-        for row, item in enumerate(items):
-            # Name
-            name_item = QTableWidgetItem(item['name'])
-            self.table.setItem(row, 0, name_item)
+        # Block signals and repaints while filling so the table redraws once
+        self.table.blockSignals(True)
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(len(items))
+
+            for row, item in enumerate(items):
+                # Name
+                name_item = QTableWidgetItem(item['name'])
+                self.table.setItem(row, 0, name_item)
 
-            # Type
-            type_item = QTableWidgetItem(item['type'])
-            self.table.setItem(row, 1, type_item)
+                # Type
+                type_item = QTableWidgetItem(item['type'])
+                self.table.setItem(row, 1, type_item)
 
-            # Status
-            status_text = "Enabled" if item.get('enabled', True) else "Disabled"
-            status_item = QTableWidgetItem(status_text)
-            self.table.setItem(row, 2, status_item)
+                # Status
+                status_text = "Enabled" if item.get('enabled', True) else "Disabled"
+                status_item = QTableWidgetItem(status_text)
+                self.table.setItem(row, 2, status_item)
 
-            # Location
-            location = item.get('location', item.get('path', 'N/A'))
-            location_item = QTableWidgetItem(location)
-            self.table.setItem(row, 3, location_item)
+                # Location
+                location = item.get('location', item.get('path', 'N/A'))
+                location_item = QTableWidgetItem(location)
+                self.table.setItem(row, 3, location_item)
 
-            # Toggle switch (as text for now, could be custom widget)
-            toggle_item = QTableWidgetItem("●" if item.get('enabled', True) else "○")
-            toggle_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 4, toggle_item)
+                # Toggle switch (as text for now, could be custom widget)
+                toggle_item = QTableWidgetItem("●" if item.get('enabled', True) else "○")
+                toggle_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.table.setItem(row, 4, toggle_item)
 
-            # Store item data
-            name_item.setData(Qt.ItemDataRole.UserRole, item)
+                # Store item data
+                name_item.setData(Qt.ItemDataRole.UserRole, item)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
 
         # CRITICAL FIX: Clear sort indicator BEFORE re-enabling to prevent automatic re-sort
         # This prevents Qt from automatically sorting on the UI thread, which causes freezes
@@ -3,6 +3,9 @@ UI Styling for Mac Health Analyzer.
 Professional design with warm earth tones and sophisticated visual polish.
 """
 
+from bisect import bisect_right
+from functools import lru_cache
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QPalette
 
@@ -79,10 +82,13 @@ COLORS = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_main_stylesheet() -> str:
     """
     Get the main application stylesheet with refined professional earth design.
 
+    The stylesheet only depends on COLORS, so it is built once and cached.
+
     Returns:
         QStyleSheet string with expert-level polish and depth
     """
@@ -569,6 +575,11 @@ def get_main_stylesheet() -> str:
     """
 
 
+# Usage percentages at which the status color steps up a band
+STATUS_THRESHOLDS = (50.0, 80.0)
+STATUS_BANDS = ('status_low', 'status_medium', 'status_high')
+
+
 def get_status_color(percent: float) -> str:
     """
     Get status color based on percentage.
@@ -579,12 +590,7 @@ def get_status_color(percent: float) -> str:
     Returns:
         Color hex code
     """
-    if percent < 50:
-        return COLORS['status_low']
-    elif percent < 80:
-        return COLORS['status_medium']
-    else:
-        return COLORS['status_high']
+    return COLORS[STATUS_BANDS[bisect_right(STATUS_THRESHOLDS, percent)]]
 
 
 def get_palette() -> QPalette:
@@ -592,8 +598,14 @@ def get_palette() -> QPalette:
     Get application color palette.
 
     Returns:
-        QPalette object
+        QPalette object (a copy of the cached palette, safe to modify)
     """
+    return QPalette(_build_palette())
+
+
+@lru_cache(maxsize=1)
+def _build_palette() -> QPalette:
+    """Build the application color palette once."""
     palette = QPalette()
 
     # Window
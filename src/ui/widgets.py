@@ -3,7 +3,7 @@ Custom styled widgets for the Mac Health Analyzer.
 Professional components with micro-interactions and visual polish.
 """
 
-from PyQt6.QtCore import Qt, pyqtSignal, QRect, QPropertyAnimation, QEasingCurve, pyqtProperty, QVariantAnimation
+from PyQt6.QtCore import Qt, pyqtSignal, QRect, QRectF, QPropertyAnimation, QEasingCurve, pyqtProperty, QVariantAnimation
 from PyQt6.QtWidgets import (
     QWidget,
     QPushButton,
@@ -180,7 +180,7 @@ class ToggleSwitch(QWidget):
         # Inner shadow (more prominent)
         shadow_inner = QColor(0, 0, 0, 15)
         painter.setBrush(QBrush(shadow_inner))
-        painter.drawEllipse(self._circle_position + 0.5, 2.5, 24, 24)
+        painter.drawEllipse(QRectF(self._circle_position + 0.5, 2.5, 24, 24))
 
         # Circle with subtle border for definition
         circle_border = QColor(COLORS['border_dark']) if not self._checked else QColor(COLORS['terracotta_dark'])
@@ -5,6 +5,7 @@ This module contains pytest configuration, fixtures, and test utilities
 that are shared across all test modules.
 """
 
+import functools
 import importlib.util
 import json
 import os
@@ -16,13 +17,21 @@ from unittest.mock import MagicMock, Mock
 import psutil
 import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Headless Qt: must be set before anything imports PyQt6.QtWidgets
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Silence Qt debug/warning chatter but keep critical messages
+os.environ.setdefault("QT_LOGGING_RULES", "*.debug=false;*.warning=false")
+
+# Add parent directory to path for imports; test modules rely on this
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 
 # ========== Application Fixtures ==========
 
 
+@functools.lru_cache(maxsize=None)
 def _plugin_available(module_name: str) -> bool:
     """Check whether an optional pytest plugin is importable."""
 
@@ -56,7 +65,6 @@ def qapp():
     # Skip if we're not in a proper GUI environment
     try:
         import PyQt6.QtCore
-        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
         from PyQt6.QtWidgets import QApplication
 
         app = QApplication.instance()
@@ -68,6 +76,16 @@ def qapp():
         pytest.skip(f"PyQt6 not available in this environment: {e}")
 
 
+@pytest.fixture
+def widget(qapp):
+    """Provide a plain QWidget that is scheduled for deletion after the test."""
+    from PyQt6.QtWidgets import QWidget
+
+    widget = QWidget()
+    yield widget
+    widget.deleteLater()
+
+
 @pytest.fixture
 def qapp_args():
     """Provide QApplication arguments."""
@@ -338,9 +356,6 @@ def assert_called_with_timeout():
 
 def pytest_configure(config):
     """Configure pytest with custom settings."""
-    # Set QT_QPA_PLATFORM for headless testing
-    os.environ["QT_QPA_PLATFORM"] = "offscreen"
-
     # Add custom markers
     config.addinivalue_line(
         "markers", "unit: Unit tests for individual functions"
@@ -367,11 +382,25 @@ def pytest_collection_modifyitems(config, items):
 
 # ========== Mock Manager Instances ==========
 
+@pytest.fixture(scope="session")
+def manager_specs():
+    """Public attribute names of the real managers, introspected once per session."""
+    from process_monitor import ProcessMonitor
+    from startup_manager import StartupManager
+
+    # StartupManager exposes data_updated per instance rather than on the class
+    return {
+        cls: sorted({name for name in dir(cls) if not name.startswith('_')} | {'data_updated'})
+        for cls in (ProcessMonitor, StartupManager)
+    }
+
+
 @pytest.fixture
-def mock_process_monitor():
+def mock_process_monitor(manager_specs):
     """Mock ProcessMonitor instance."""
     from unittest.mock import Mock
-    monitor = Mock()
+    from process_monitor import ProcessMonitor
+    monitor = Mock(spec=manager_specs[ProcessMonitor])
     monitor.processes = []
     monitor.refresh = Mock()
     monitor.get_processes = Mock(return_value=[])
@@ -382,10 +411,11 @@ def mock_process_monitor():
 
 
 @pytest.fixture
-def mock_startup_manager():
+def mock_startup_manager(manager_specs):
     """Mock StartupManager instance."""
     from unittest.mock import Mock
-    manager = Mock()
+    from startup_manager import StartupManager
+    manager = Mock(spec=manager_specs[StartupManager])
     manager.all_items = []
     manager.refresh = Mock()
     manager.get_all_items = Mock(return_value=[])
@@ -5,64 +5,93 @@ Tests the integration between managers and their dependencies.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 import time
 
 from process_monitor import ProcessMonitor
 from startup_manager import StartupManager
 
 
+# Shared read-only scan results; tests wrap them in fresh lists
+LOGIN_ITEMS = (
+    MappingProxyType({'name': 'Dropbox', 'type': 'Login Item', 'enabled': True}),
+    MappingProxyType({'name': 'Slack', 'type': 'Login Item', 'enabled': True}),
+)
+AGENTS = (
+    MappingProxyType(
+        {'name': 'Agent1', 'label': 'com.agent1', 'type': 'Launch Agent', 'enabled': True}
+    ),
+    MappingProxyType(
+        {'name': 'Agent2', 'label': 'com.agent2', 'type': 'Launch Agent', 'enabled': False}
+    ),
+)
+DAEMONS = (
+    MappingProxyType(
+        {'name': 'Daemon1', 'label': 'com.daemon1', 'type': 'Launch Daemon', 'enabled': True}
+    ),
+)
+
+
+@pytest.fixture(scope="class")
+def refreshed_manager(qapp):
+    """One StartupManager refreshed against the shared scan payloads."""
+    with patch.multiple(
+        'startup_manager',
+        fetch_launchctl_status=DEFAULT,
+        get_launch_daemons=DEFAULT,
+        get_launch_agents=DEFAULT,
+        get_login_items=DEFAULT,
+    ) as mocks:
+        mocks['fetch_launchctl_status'].return_value = {'com.agent1', 'com.daemon1'}
+        mocks['get_login_items'].return_value = list(LOGIN_ITEMS)
+        mocks['get_launch_agents'].return_value = list(AGENTS)
+        mocks['get_launch_daemons'].return_value = list(DAEMONS)
+
+        manager = StartupManager()
+        manager.refresh()
+        # The scan runs on the thread pool; deliver its queued result
+        manager._thread_pool.waitForDone()
+        qapp.processEvents()
+
+    return manager
+
+
 class TestStartupManagerIntegration:
     """Integration tests for StartupManager with real dependencies."""
 
     @pytest.mark.integration
-    @patch('startup_manager.fetch_launchctl_status')
-    @patch('startup_manager.get_launch_daemons')
-    @patch('startup_manager.get_launch_agents')
-    @patch('startup_manager.get_login_items')
-    def test_full_refresh_cycle(self, mock_login, mock_agents, mock_daemons, mock_fetch):
+    def test_full_refresh_cycle(self, refreshed_manager):
         """Test complete refresh cycle with all dependencies."""
-        # Mock all dependencies
-        mock_fetch.return_value = {'com.agent1', 'com.daemon1'}
-        mock_login.return_value = [
-            {'name': 'Dropbox', 'type': 'Login Item', 'enabled': True},
-            {'name': 'Slack', 'type': 'Login Item', 'enabled': True},
-        ]
-        mock_agents.return_value = [
-            {'name': 'Agent1', 'label': 'com.agent1', 'type': 'Launch Agent', 'enabled': True},
-            {'name': 'Agent2', 'label': 'com.agent2', 'type': 'Launch Agent', 'enabled': False},
-        ]
-        mock_daemons.return_value = [
-            {'name': 'Daemon1', 'label': 'com.daemon1', 'type': 'Launch Daemon', 'enabled': True},
-        ]
-
-        # Create manager and refresh
-        manager = StartupManager()
-        result = manager.refresh()
-
-        # Verify all items were loaded
-        assert len(result) == 5
-        assert len(manager.get_login_items_only()) == 2
-        assert len(manager.get_launch_agents_only()) == 2
-        assert len(manager.get_launch_daemons_only()) == 1
-
-        # Test filtering
-        enabled = manager.get_enabled_items()
-        disabled = manager.get_disabled_items()
-        assert len(enabled) == 4
-        assert len(disabled) == 1
-
-        # Test searching
-        dropbox_items = manager.search_items('dropbox')
+        assert len(refreshed_manager.get_all_items()) == 5
+        assert len(refreshed_manager.get_login_items_only()) == 2
+        assert len(refreshed_manager.get_launch_agents_only()) == 2
+        assert len(refreshed_manager.get_launch_daemons_only()) == 1
+
+    @pytest.mark.integration
+    def test_enabled_disabled_filtering(self, refreshed_manager):
+        """Test enabled/disabled filtering after a refresh."""
+        assert len(refreshed_manager.get_enabled_items()) == 4
+        assert len(refreshed_manager.get_disabled_items()) == 1
+
+    @pytest.mark.integration
+    def test_search_after_refresh(self, refreshed_manager):
+        """Test searching refreshed items."""
+        dropbox_items = refreshed_manager.search_items('dropbox')
+
         assert len(dropbox_items) == 1
         assert dropbox_items[0]['name'] == 'Dropbox'
 
-        # Test type filtering
-        agents = manager.filter_by_type('Launch Agent')
-        assert len(agents) == 2
+    @pytest.mark.integration
+    def test_filter_by_type_after_refresh(self, refreshed_manager):
+        """Test type filtering after a refresh."""
+        assert len(refreshed_manager.filter_by_type('Launch Agent')) == 2
+
+    @pytest.mark.integration
+    def test_summary_after_refresh(self, refreshed_manager):
+        """Test summary statistics after a refresh."""
+        summary = refreshed_manager.get_summary()
 
-        # Test summary
-        summary = manager.get_summary()
         assert summary['total'] == 5
         assert summary['enabled'] == 4
         assert summary['disabled'] == 1
@@ -71,46 +100,61 @@ class TestStartupManagerIntegration:
         assert summary['launch_daemons'] == 1
 
     @pytest.mark.integration
-    @patch('startup_manager.time.time')
-    @patch('startup_manager.fetch_launchctl_status')
-    @patch('startup_manager.get_launch_daemons')
-    @patch('startup_manager.get_launch_agents')
-    @patch('startup_manager.get_login_items')
-    def test_launchctl_caching_behavior(self, mock_login, mock_agents, mock_daemons,
-                                       mock_fetch, mock_time):
+    @patch('startup_manager.time.monotonic')
+    @patch.multiple(
+        'startup_manager',
+        fetch_launchctl_status=DEFAULT,
+        get_launch_daemons=DEFAULT,
+        get_launch_agents=DEFAULT,
+        get_login_items=DEFAULT,
+    )
+    def test_launchctl_caching_behavior(self, mock_time, qapp, **mocks):
         """Test that launchctl caching works correctly across multiple refreshes."""
-        mock_login.return_value = []
-        mock_agents.return_value = []
-        mock_daemons.return_value = []
+        mock_fetch = mocks['fetch_launchctl_status']
+        mocks['get_login_items'].return_value = []
+        mocks['get_launch_agents'].return_value = []
+        mocks['get_launch_daemons'].return_value = []
         mock_fetch.return_value = {'com.test'}
 
         manager = StartupManager()
 
+        def refresh_and_wait():
+            # The scan runs on the thread pool; deliver its queued result
+            manager.refresh()
+            manager._thread_pool.waitForDone()
+            qapp.processEvents()
+
         # First refresh at time 0
         mock_time.return_value = 0.0
-        manager.refresh()
+        refresh_and_wait()
         assert mock_fetch.call_count == 1
 
         # Refresh at time 2 (should use cache)
         mock_time.return_value = 2.0
-        manager.refresh()
+        refresh_and_wait()
         assert mock_fetch.call_count == 1
 
         # Refresh at time 6 (should refresh cache)
         mock_time.return_value = 6.0
-        manager.refresh()
+        refresh_and_wait()
         assert mock_fetch.call_count == 2
 
         # Verify cache is passed to get functions
-        mock_agents.assert_called_with(loaded_labels={'com.test'})
-        mock_daemons.assert_called_with(loaded_labels={'com.test'})
+        mocks['get_launch_agents'].assert_called_with(loaded_labels={'com.test'})
+        mocks['get_launch_daemons'].assert_called_with(loaded_labels={'com.test'})
 
     @pytest.mark.integration
-    @patch('startup_manager.enable_launch_agent')
-    @patch('startup_manager.disable_launch_agent')
-    @patch('startup_manager.disable_login_item')
-    def test_enable_disable_workflow(self, mock_disable_login, mock_disable_agent, mock_enable_agent):
+    @patch.multiple(
+        'startup_manager',
+        enable_launch_agent=DEFAULT,
+        disable_launch_agent=DEFAULT,
+        disable_login_item=DEFAULT,
+    )
+    def test_enable_disable_workflow(self, **mocks):
         """Test complete enable/disable workflow."""
+        mock_disable_login = mocks['disable_login_item']
+        mock_disable_agent = mocks['disable_launch_agent']
+        mock_enable_agent = mocks['enable_launch_agent']
         mock_disable_login.return_value = True
         mock_disable_agent.return_value = True
         mock_enable_agent.return_value = True
@@ -4,10 +4,11 @@ Tests for ui/charts.py - Chart widgets
 
 import sys
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QEvent, QPointF, Qt
+from PyQt6.QtGui import QMouseEvent
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -96,6 +97,16 @@ class TestCircularGauge:
         # Should update without error
         gauge.update()
 
+    def test_set_value_unchanged_skips_update(self, qapp):
+        """Test that setting the same value does not schedule a repaint."""
+        gauge = CircularGauge("CPU", "%")
+        gauge.set_value(50.0, 100.0)
+
+        with patch.object(gauge, 'update') as mock_update:
+            gauge.set_value(50.0, 100.0)
+
+        mock_update.assert_not_called()
+
     def test_paint_event(self, qapp):
         """Test paint event."""
         gauge = CircularGauge("Processes", "")
@@ -144,30 +155,45 @@ class TestBarChart:
         # Should update without error
         chart.update()
 
-    def test_mouse_double_click_event(self, qapp):
-        """Test mouse double-click event."""
+    # Chart is 400px wide: bars start at y=40 and y=73 (25px tall, 8px apart)
+    # and the hit area spans BAR_LEFT (10) to 10 + (400 - 120 + 80) = 370
+    @pytest.mark.parametrize("x,y,expected_pid", [
+        (50, 50, 1),
+        (50, 80, 2),
+        (369, 50, 1),
+        (50, 68, None),
+        (50, 110, None),
+        (50, 20, None),
+        (5, 50, None),
+        (370, 50, None),
+    ], ids=["first_bar", "second_bar", "right_edge", "gap", "below_last",
+            "above_first", "left_of_bars", "right_of_hit_width"])
+    def test_mouse_double_click_event(self, qapp, x, y, expected_pid):
+        """Test double-click hit-testing against the painted bars."""
         chart = BarChart("Top CPU")
+        chart.resize(400, 200)
+        chart.set_data([
+            {'label': 'Chrome', 'value': 45.0, 'max': 100, 'payload': {'pid': 1}},
+            {'label': 'Firefox', 'value': 30.0, 'max': 100, 'payload': {'pid': 2}},
+        ])
+        # Painting records the bar geometry used for hit-testing
+        chart.grab()
 
-        data = [
-            {'label': 'Chrome', 'value': 45.0, 'max': 100, 'payload': {'pid': 123}},
-        ]
-        chart.set_data(data)
-
-        # Track signal emissions
         signals = []
-        chart.clicked.connect(lambda entry: signals.append(entry))
-
-        # Create a mock mouse event
-        event = Mock()
-        event.button.return_value = Qt.MouseButton.LeftButton
-        event.pos.return_value.x.return_value = 100
-        event.pos.return_value.y.return_value = 100
-
-        # Simulate double-click
+        chart.clicked.connect(signals.append)
+
+        event = QMouseEvent(
+            QEvent.Type.MouseButtonDblClick,
+            QPointF(x, y),
+            QPointF(x, y),
+            Qt.MouseButton.LeftButton,
+            Qt.MouseButton.LeftButton,
+            Qt.KeyboardModifier.NoModifier,
+        )
         chart.mouseDoubleClickEvent(event)
 
-        # Signal should be emitted (if clicked on a valid bar)
-        # Note: actual click detection depends on geometry, so we just verify no crash
+        expected = [] if expected_pid is None else [expected_pid]
+        assert [entry['payload']['pid'] for entry in signals] == expected
 
     def test_paint_event(self, qapp):
         """Test paint event."""
@@ -2,66 +2,263 @@
 Tests for ui/dashboard.py - Dashboard class
 """
 
-import sys
-from pathlib import Path
+from collections import namedtuple
+from contextlib import ExitStack
 from unittest.mock import Mock, patch, MagicMock, PropertyMock
 
 import pytest
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import QTimer
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from PyQt6.QtCore import QSignalBlocker, pyqtSignal
+from PyQt6.QtWidgets import QWidget
 
 from ui.dashboard import Dashboard
 
 
+# Heavy child widgets replaced by stub widgets whenever a Dashboard is built
+DASHBOARD_UI_PATCHES = (
+    'StartupTab', 'ProcessesTab', 'GlassmorphicPanel', 'MetricCard',
+    'CircularGauge', 'RealtimeLineChart', 'BarChart',
+)
+
+# Overview widgets replaced by mocks before update_overview_tab() runs, with
+# the only methods the overview update calls on each
+OVERVIEW_WIDGET_SPECS = {
+    'cpu_gauge': ['set_value'],
+    'memory_gauge': ['set_value'],
+    'cpu_chart': ['update_data'],
+    'memory_chart': ['update_data'],
+    'memory_bar_chart': ['set_data'],
+    'cpu_bar_chart': ['set_data'],
+    'total_memory_card': ['update_value'],
+    'cpu_cores_card': ['update_value'],
+    'startup_items_card': ['update_value'],
+    'status_label': ['setText'],
+}
+
+DashboardMocks = namedtuple('DashboardMocks', [
+    'dashboard', 'startup_manager', 'process_monitor', 'mock_gauge', 'mock_chart',
+    'mock_bar', 'mock_card', 'mock_startup_tab', 'mock_processes_tab',
+])
+
+
+@pytest.fixture(scope="module")
+def dashboard_startup_manager():
+    """StartupManager mock shared by the class-scoped Dashboard."""
+    return Mock()
+
+
+@pytest.fixture(scope="module")
+def dashboard_process_monitor():
+    """ProcessMonitor mock shared by the class-scoped Dashboard."""
+    return Mock()
+
+
+def _apply_dashboard_return_values(startup_manager, process_monitor):
+    """Set the canned manager data the Dashboard reads."""
+    process_monitor.get_memory_info.return_value = {
+        'percent': 50.0,
+        'total_human': '16 GB',
+        'used_human': '8 GB',
+        'available_human': '8 GB',
+    }
+    process_monitor.get_cpu_info.return_value = {
+        'percent': 35.0,
+        'count_logical': 16,
+        'count_physical': 8,
+    }
+    process_monitor.get_process_count.return_value = 150
+    process_monitor.get_top_memory_processes.return_value = []
+    process_monitor.get_top_cpu_processes.return_value = []
+    process_monitor.get_top_processes.return_value = {'memory': [], 'cpu': []}
+
+    startup_manager.get_summary.return_value = {
+        'total': 10,
+        'enabled': 5,
+        'disabled': 5,
+    }
+
+
+class _StubWidget(QWidget):
+    """Bare QWidget standing in for a patched child widget."""
+
+    clicked = pyqtSignal(dict)
+
+    def __getattr__(self, name):
+        # Widget-specific API (set_value, update_data, ...) becomes a Mock
+        if name.startswith('__'):
+            raise AttributeError(name)
+        attr = Mock(name=name)
+        setattr(self, name, attr)
+        return attr
+
+
+class _FakeTabWidget(QWidget):
+    """QTabWidget stand-in that only tracks its tabs and current index."""
+
+    currentChanged = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tabs = []
+        self._current = -1
+
+    def addTab(self, widget, label):
+        self._tabs.append(widget)
+        if self._current < 0:
+            self.setCurrentIndex(0)
+        return len(self._tabs) - 1
+
+    def count(self):
+        return len(self._tabs)
+
+    def widget(self, index):
+        return self._tabs[index] if 0 <= index < len(self._tabs) else None
+
+    def indexOf(self, widget):
+        return next((i for i, tab in enumerate(self._tabs) if tab is widget), -1)
+
+    def currentIndex(self):
+        return self._current
+
+    def currentWidget(self):
+        return self.widget(self._current)
+
+    def setCurrentIndex(self, index):
+        if index != self._current and 0 <= index < len(self._tabs):
+            self._current = index
+            self.currentChanged.emit(index)
+
+    def setCurrentWidget(self, widget):
+        self.setCurrentIndex(self.indexOf(widget))
+
+
+@pytest.fixture(autouse=True)
+def _reset_dashboard_managers(dashboard_startup_manager, dashboard_process_monitor):
+    """Give every test freshly seeded manager mocks and clear them afterwards."""
+    _apply_dashboard_return_values(dashboard_startup_manager, dashboard_process_monitor)
+    yield
+    for manager in (dashboard_startup_manager, dashboard_process_monitor):
+        manager.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="class", autouse=True)
+def _patch_ui_symbols(request):
+    """Patch the Dashboard's heavy child widgets once per test class."""
+    with ExitStack() as stack:
+        mocks = {
+            name: stack.enter_context(
+                patch(f'ui.dashboard.{name}', side_effect=lambda *args, **kwargs: _StubWidget())
+            )
+            for name in DASHBOARD_UI_PATCHES
+        }
+        mocks['QTabWidget'] = stack.enter_context(
+            patch('ui.dashboard.QTabWidget', side_effect=_FakeTabWidget)
+        )
+        if request.cls is not None:
+            request.cls._ui_mocks = mocks
+        yield mocks
+
+
+@pytest.fixture(scope="class")
+def _dashboard_template(qapp, _patch_ui_symbols, dashboard_startup_manager,
+                        dashboard_process_monitor):
+    """Build one patched Dashboard shared by the test class."""
+    _apply_dashboard_return_values(dashboard_startup_manager, dashboard_process_monitor)
+    dashboard = Dashboard(dashboard_startup_manager, dashboard_process_monitor)
+
+    # Attributes tests may replace, restored before each test
+    dashboard._pristine_attrs = dict(vars(dashboard))
+    yield dashboard
+
+    dashboard.deleteLater()
+    qapp.processEvents()
+    qapp.sendPostedEvents(None, 0)
+
+
+@pytest.fixture(scope="class")
+def patched_dashboard_with_mocks(qapp, _patch_ui_symbols):
+    """Build one Dashboard while keeping handles to its patched dependencies."""
+    startup_manager = Mock()
+    process_monitor = Mock()
+    _apply_dashboard_return_values(startup_manager, process_monitor)
+
+    # Count only the widgets this construction creates
+    for mock in _patch_ui_symbols.values():
+        mock.reset_mock()
+    dashboard = Dashboard(startup_manager, process_monitor)
+
+    yield DashboardMocks(
+        dashboard=dashboard,
+        startup_manager=startup_manager,
+        process_monitor=process_monitor,
+        mock_gauge=_patch_ui_symbols['CircularGauge'],
+        mock_chart=_patch_ui_symbols['RealtimeLineChart'],
+        mock_bar=_patch_ui_symbols['BarChart'],
+        mock_card=_patch_ui_symbols['MetricCard'],
+        mock_startup_tab=_patch_ui_symbols['StartupTab'],
+        mock_processes_tab=_patch_ui_symbols['ProcessesTab'],
+    )
+
+    dashboard.deleteLater()
+    qapp.processEvents()
+    qapp.sendPostedEvents(None, 0)
+
+
+def _show_tab(dashboard, tab):
+    """Switch tabs without running the currentChanged slot."""
+    with QSignalBlocker(dashboard.tab_widget):
+        dashboard.tab_widget.setCurrentWidget(tab)
+    dashboard._active_tab = tab
+
+
+def _check_overview_widgets(m):
+    """Overview tab creates its gauges, charts and cards."""
+    assert m.mock_gauge.call_count == 2  # CPU and Memory gauges
+    assert m.mock_chart.call_count == 2  # CPU and Memory charts
+    assert m.mock_bar.call_count == 2  # Memory and CPU bar charts
+    assert m.mock_card.call_count == 3  # System info cards
+
+
+def _check_signal_connections(m):
+    """Data, tab and bar-chart signals are wired to their slots."""
+    m.process_monitor.data_updated.connect.assert_called_once_with(
+        m.dashboard.on_data_updated
+    )
+    tab_widget = m.dashboard.tab_widget
+    assert tab_widget.receivers(tab_widget.currentChanged) == 1
+    for bar_chart in (m.dashboard.memory_bar_chart, m.dashboard.cpu_bar_chart):
+        assert bar_chart.receivers(bar_chart.clicked) == 1
+
+
+def _check_initial_data(m):
+    """Startup items are refreshed and the overview is filled on construction."""
+    m.startup_manager.refresh.assert_called_once_with()
+    m.dashboard.startup_tab.update_data.assert_called_once_with()
+    m.dashboard.cpu_gauge.set_value.assert_called_with(35.0, 100)
+    m.dashboard.memory_gauge.set_value.assert_called_with(50.0, 100)
+    assert m.dashboard.status_label.text() == "● ONLINE"
+
+
 class TestDashboard:
     """Test Dashboard class."""
 
     @pytest.fixture
-    def dashboard(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Create a Dashboard instance for testing."""
-        with patch('ui.dashboard.StartupTab'), \
-             patch('ui.dashboard.ProcessesTab'), \
-             patch('ui.dashboard.GlassmorphicPanel'), \
-             patch('ui.dashboard.MetricCard'), \
-             patch('ui.dashboard.CircularGauge'), \
-             patch('ui.dashboard.RealtimeLineChart'), \
-             patch('ui.dashboard.BarChart'):
-
-            mock_process_monitor.get_memory_info.return_value = {
-                'percent': 50.0,
-                'total_human': '16 GB',
-                'used_human': '8 GB',
-                'available_human': '8 GB',
-            }
-            mock_process_monitor.get_cpu_info.return_value = {
-                'percent': 35.0,
-                'count_logical': 16,
-                'count_physical': 8,
-            }
-            mock_process_monitor.get_process_count.return_value = 150
-            mock_process_monitor.get_top_memory_processes.return_value = []
-            mock_process_monitor.get_top_cpu_processes.return_value = []
-
-            mock_startup_manager.get_summary.return_value = {
-                'total': 10,
-                'enabled': 5,
-                'disabled': 5,
-            }
-
-            dashboard = Dashboard(mock_startup_manager, mock_process_monitor)
-
-            # Stop timers to prevent interference
-            dashboard.process_timer.stop()
-            dashboard.overview_timer.stop()
-
-            return dashboard
-
-    def test_initialization(self, dashboard, mock_startup_manager, mock_process_monitor):
+    def dashboard(self, qapp, _dashboard_template):
+        """Reset the shared Dashboard for a test and drain its queued events."""
+        dashboard = _dashboard_template
+        vars(dashboard).update(dashboard._pristine_attrs)
+        with QSignalBlocker(dashboard.tab_widget):
+            dashboard.tab_widget.setCurrentIndex(0)
+
+        yield dashboard
+
+        # Keep queued events from piling up across tests
+        qapp.processEvents()
+        qapp.sendPostedEvents(None, 0)
+
+    def test_initialization(self, dashboard, dashboard_startup_manager, dashboard_process_monitor):
         """Test Dashboard initialization."""
-        assert dashboard.startup_manager == mock_startup_manager
-        assert dashboard.process_monitor == mock_process_monitor
+        assert dashboard.startup_manager == dashboard_startup_manager
+        assert dashboard.process_monitor == dashboard_process_monitor
         assert dashboard.tab_widget is not None
 
     def test_setup_ui(self, dashboard):
@@ -69,53 +266,19 @@ class TestDashboard:
         assert dashboard.tab_widget is not None
         assert dashboard.tab_widget.count() == 3  # Startup, Processes, System tabs
 
-    def test_create_enhanced_overview_tab(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Test overview tab creation."""
-        with patch('ui.dashboard.StartupTab'), \
-             patch('ui.dashboard.ProcessesTab'), \
-             patch('ui.dashboard.GlassmorphicPanel') as mock_panel, \
-             patch('ui.dashboard.MetricCard') as mock_card, \
-             patch('ui.dashboard.CircularGauge') as mock_gauge, \
-             patch('ui.dashboard.RealtimeLineChart') as mock_chart, \
-             patch('ui.dashboard.BarChart') as mock_bar:
-
-            mock_process_monitor.get_memory_info.return_value = {'percent': 50.0, 'total_human': '16 GB'}
-            mock_process_monitor.get_cpu_info.return_value = {'percent': 35.0, 'count_logical': 16}
-            mock_process_monitor.get_process_count.return_value = 150
-            mock_startup_manager.get_summary.return_value = {'total': 10, 'enabled': 5, 'disabled': 5}
-
-            dashboard = Dashboard(mock_startup_manager, mock_process_monitor)
-
-            assert mock_gauge.call_count >= 3  # CPU, Memory, Processes gauges
-            assert mock_chart.call_count >= 2  # CPU and Memory charts
-            assert mock_bar.call_count >= 2  # Memory and CPU bar charts
-            assert mock_card.call_count >= 3  # System info cards
-
-    def test_setup_timers(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Test timer setup."""
-        with patch('ui.dashboard.StartupTab'), \
-             patch('ui.dashboard.ProcessesTab'), \
-             patch('ui.dashboard.GlassmorphicPanel'), \
-             patch('ui.dashboard.MetricCard'), \
-             patch('ui.dashboard.CircularGauge'), \
-             patch('ui.dashboard.RealtimeLineChart'), \
-             patch('ui.dashboard.BarChart'):
-
-            mock_process_monitor.get_memory_info.return_value = {'percent': 50.0, 'total_human': '16 GB'}
-            mock_process_monitor.get_cpu_info.return_value = {'percent': 35.0, 'count_logical': 16}
-            mock_process_monitor.get_process_count.return_value = 150
-            mock_startup_manager.get_summary.return_value = {'total': 10, 'enabled': 5}
-
-            dashboard = Dashboard(mock_startup_manager, mock_process_monitor)
-
-            assert dashboard.process_timer is not None
-            assert dashboard.overview_timer is not None
-            assert isinstance(dashboard.process_timer, QTimer)
-            assert isinstance(dashboard.overview_timer, QTimer)
+    @pytest.mark.parametrize("check", [
+        pytest.param(_check_overview_widgets, id="create_enhanced_overview_tab"),
+        pytest.param(_check_signal_connections, id="signal_connections"),
+        pytest.param(_check_initial_data, id="load_initial_data"),
+    ])
+    def test_construction(self, patched_dashboard_with_mocks, check):
+        """Test what Dashboard construction sets up."""
+        check(patched_dashboard_with_mocks)
 
     def test_on_tab_changed_processes(self, dashboard):
         """Test tab change to processes tab."""
-        dashboard.tab_widget.setCurrentIndex(1)  # Processes tab
+        with QSignalBlocker(dashboard.tab_widget):
+            dashboard.tab_widget.setCurrentIndex(1)  # Processes tab
         dashboard.on_tab_changed(1)
 
         # Should trigger update_data on processes tab
@@ -123,121 +286,77 @@ class TestDashboard:
 
     def test_on_tab_changed_overview(self, dashboard):
         """Test tab change to overview tab."""
-        with patch.object(dashboard, 'refresh_overview') as mock_refresh:
+        with patch.object(dashboard, 'update_overview_tab') as mock_update:
             # Set to system/overview tab (index 2)
-            dashboard.tab_widget.setCurrentIndex(2)
+            with QSignalBlocker(dashboard.tab_widget):
+                dashboard.tab_widget.setCurrentIndex(2)
             dashboard.on_tab_changed(2)
 
             # Should refresh overview
-            mock_refresh.assert_called_once()
-
-    def test_load_initial_data(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Test initial data loading."""
-        with patch('ui.dashboard.StartupTab') as mock_startup_tab, \
-             patch('ui.dashboard.ProcessesTab') as mock_processes_tab, \
-             patch('ui.dashboard.GlassmorphicPanel'), \
-             patch('ui.dashboard.MetricCard'), \
-             patch('ui.dashboard.CircularGauge'), \
-             patch('ui.dashboard.RealtimeLineChart'), \
-             patch('ui.dashboard.BarChart'):
-
-            mock_process_monitor.get_memory_info.return_value = {'percent': 50.0, 'total_human': '16 GB'}
-            mock_process_monitor.get_cpu_info.return_value = {'percent': 35.0, 'count_logical': 16}
-            mock_process_monitor.get_process_count.return_value = 150
-            mock_startup_manager.get_summary.return_value = {'total': 10, 'enabled': 5}
-
-            # Mock tab instances
-            startup_instance = MagicMock()
-            processes_instance = MagicMock()
-            mock_startup_tab.return_value = startup_instance
-            mock_processes_tab.return_value = processes_instance
-
-            dashboard = Dashboard(mock_startup_manager, mock_process_monitor)
-
-            # Check that managers were refreshed
-            mock_startup_manager.refresh.assert_called()
-            mock_process_monitor.refresh.assert_called()
-
-    def test_refresh_processes(self, dashboard):
-        """Test process refresh."""
-        dashboard.tab_widget.setCurrentWidget(dashboard.processes_tab)
+            mock_update.assert_called_once()
+
+    @pytest.mark.parametrize("tab_name,visible,expected_calls", [
+        ('processes_tab', True, 1),
+        ('processes_tab', False, 0),
+        ('startup_tab', True, 0),
+    ], ids=["processes_visible", "dashboard_hidden", "other_tab"])
+    def test_data_updated_refreshes_processes(self, dashboard, tab_name, visible, expected_calls):
+        """Test new monitor data only refreshes a visible processes tab."""
+        _show_tab(dashboard, getattr(dashboard, tab_name))
         dashboard.processes_tab.update_data = Mock()
 
-        dashboard.refresh_processes()
+        with patch.object(dashboard, 'isVisible', return_value=visible):
+            dashboard.on_data_updated()
 
-        # Should update data
-        dashboard.processes_tab.update_data.assert_called_once()
-
-    def test_refresh_processes_not_visible(self, dashboard):
-        """Test process refresh when tab not visible."""
-        dashboard.tab_widget.setCurrentWidget(dashboard.startup_tab)
-        dashboard.processes_tab.update_data = Mock()
+        assert dashboard.processes_tab.update_data.call_count == expected_calls
 
-        dashboard.refresh_processes()
-
-        # Should NOT update data
-        dashboard.processes_tab.update_data.assert_not_called()
-
-    def test_refresh_overview(self, dashboard, mock_process_monitor, mock_startup_manager):
-        """Test overview refresh."""
-        dashboard.tab_widget.setCurrentWidget(dashboard.overview_tab)
-
-        # Mock all the gauge and chart update methods
-        dashboard.cpu_gauge = MagicMock()
-        dashboard.memory_gauge = MagicMock()
-        dashboard.processes_gauge = MagicMock()
-        dashboard.cpu_chart = MagicMock()
-        dashboard.memory_chart = MagicMock()
-        dashboard.memory_bar_chart = MagicMock()
-        dashboard.cpu_bar_chart = MagicMock()
-        dashboard.total_memory_card = MagicMock()
-        dashboard.cpu_cores_card = MagicMock()
-        dashboard.startup_items_card = MagicMock()
-        dashboard.status_label = MagicMock()
-
-        dashboard.refresh_overview()
-
-        # Verify gauges were updated
-        dashboard.cpu_gauge.set_value.assert_called()
-        dashboard.memory_gauge.set_value.assert_called()
-        dashboard.processes_gauge.set_value.assert_called()
-
-    def test_refresh_overview_error(self, dashboard, mock_process_monitor):
-        """Test overview refresh with error."""
-        dashboard.tab_widget.setCurrentWidget(dashboard.overview_tab)
-        dashboard.status_label = MagicMock()
+    @pytest.fixture
+    def overview_ready_dashboard(self, dashboard):
+        """Dashboard on the overview tab with its overview widgets mocked."""
+        _show_tab(dashboard, dashboard.overview_tab)
+        for name, spec in OVERVIEW_WIDGET_SPECS.items():
+            setattr(dashboard, name, Mock(spec_set=spec))
+        return dashboard
+
+    def test_update_overview_tab(self, overview_ready_dashboard):
+        """Test overview update."""
+        dashboard = overview_ready_dashboard
+
+        dashboard.update_overview_tab()
+
+        # Verify gauges and bar charts were updated
+        dashboard.cpu_gauge.set_value.assert_called_once_with(35.0, 100)
+        dashboard.memory_gauge.set_value.assert_called_once_with(50.0, 100)
+        dashboard.memory_bar_chart.set_data.assert_called_once_with([])
+        dashboard.cpu_bar_chart.set_data.assert_called_once_with([])
+        dashboard.status_label.setText.assert_called_once_with("● ONLINE")
+
+    def test_update_overview_tab_error(self, overview_ready_dashboard, dashboard_process_monitor):
+        """Test overview update with error."""
+        dashboard = overview_ready_dashboard
 
         # Make get_memory_info raise an exception
-        mock_process_monitor.get_memory_info.side_effect = Exception("Test error")
+        dashboard_process_monitor.get_memory_info.side_effect = Exception("Test error")
 
-        dashboard.refresh_overview()
+        dashboard.update_overview_tab()
 
         # Should set status to error
         dashboard.status_label.setText.assert_called_with("● ERROR")
 
-    def test_on_memory_bar_clicked(self, dashboard):
-        """Test memory bar chart click handler."""
-        with patch.object(dashboard, '_show_process_detail') as mock_show:
-            process_data = {'pid': 123, 'name': 'test'}
-            entry = {'payload': process_data}
-
-            dashboard.on_memory_bar_clicked(entry)
-
-            mock_show.assert_called_once_with(process_data)
-
-    def test_on_cpu_bar_clicked(self, dashboard):
-        """Test CPU bar chart click handler."""
+    @pytest.mark.parametrize("handler_name", ['on_memory_bar_clicked', 'on_cpu_bar_clicked'])
+    def test_bar_clicked(self, dashboard, handler_name):
+        """Test memory and CPU bar chart click handlers."""
         with patch.object(dashboard, '_show_process_detail') as mock_show:
             process_data = {'pid': 123, 'name': 'test'}
             entry = {'payload': process_data}
 
-            dashboard.on_cpu_bar_clicked(entry)
+            getattr(dashboard, handler_name)(entry)
 
             mock_show.assert_called_once_with(process_data)
 
     def test_show_process_detail(self, dashboard):
         """Test showing process detail dialog."""
-        with patch('ui.dashboard.ProcessDetailDialog') as mock_dialog:
+        with patch('ui.process_detail_dialog.ProcessDetailDialog') as mock_dialog:
             dialog_instance = MagicMock()
             mock_dialog.return_value = dialog_instance
 
@@ -247,87 +366,55 @@ class TestDashboard:
             mock_dialog.assert_called_once_with(process_data, dashboard)
             dialog_instance.exec.assert_called_once()
 
-    def test_show_memory_info(self, dashboard, mock_process_monitor):
+    def test_show_memory_info(self, dashboard, dashboard_process_monitor):
         """Test showing memory info dialog."""
-        mock_process_monitor.get_memory_info.return_value = {
+        dashboard_process_monitor.get_memory_info.return_value = {
             'total_human': '16 GB',
             'used_human': '8 GB',
             'available_human': '8 GB',
             'percent': 50.0,
         }
 
-        with patch('ui.dashboard.QMessageBox.information') as mock_msg:
+        with patch('PyQt6.QtWidgets.QMessageBox.information') as mock_msg:
             dashboard._show_memory_info()
 
             mock_msg.assert_called_once()
             args = mock_msg.call_args[0]
             assert "16 GB" in args[2]  # Message contains total memory
 
-    def test_show_cpu_info(self, dashboard, mock_process_monitor):
+    def test_show_cpu_info(self, dashboard, dashboard_process_monitor):
         """Test showing CPU info dialog."""
-        mock_process_monitor.get_cpu_info.return_value = {
+        dashboard_process_monitor.get_cpu_info.return_value = {
             'count_logical': 16,
             'count_physical': 8,
             'percent': 35.0,
         }
 
-        with patch('ui.dashboard.QMessageBox.information') as mock_msg:
+        with patch('PyQt6.QtWidgets.QMessageBox.information') as mock_msg:
             dashboard._show_cpu_info()
 
             mock_msg.assert_called_once()
             args = mock_msg.call_args[0]
             assert "16" in args[2] or "8" in args[2]  # Message contains core count
 
-    def test_show_startup_info_high(self, dashboard, mock_startup_manager):
-        """Test showing startup info dialog with high item count."""
-        mock_startup_manager.get_summary.return_value = {
-            'total': 25,
-            'enabled': 25,
-            'disabled': 0,
-        }
+    @pytest.mark.parametrize("summary,check", [
+        ({'total': 25, 'enabled': 25, 'disabled': 0}, "25"),
+        ({'total': 15, 'enabled': 15, 'disabled': 0}, None),
+        ({'total': 5, 'enabled': 5, 'disabled': 0}, None),
+    ], ids=["high", "medium", "low"])
+    def test_show_startup_info(self, dashboard, dashboard_startup_manager, summary, check):
+        """Test showing startup info dialog across item counts."""
+        dashboard_startup_manager.get_summary.return_value = summary
 
-        with patch('ui.dashboard.QMessageBox.information') as mock_msg:
+        with patch('PyQt6.QtWidgets.QMessageBox.information') as mock_msg:
             dashboard._show_startup_info()
 
             mock_msg.assert_called_once()
-            args = mock_msg.call_args[0]
-            assert "25" in args[2]
-
-    def test_show_startup_info_medium(self, dashboard, mock_startup_manager):
-        """Test showing startup info dialog with medium item count."""
-        mock_startup_manager.get_summary.return_value = {
-            'total': 15,
-            'enabled': 15,
-            'disabled': 0,
-        }
-
-        with patch('ui.dashboard.QMessageBox.information') as mock_msg:
-            dashboard._show_startup_info()
-
-            mock_msg.assert_called_once()
-
-    def test_show_startup_info_low(self, dashboard, mock_startup_manager):
-        """Test showing startup info dialog with low item count."""
-        mock_startup_manager.get_summary.return_value = {
-            'total': 5,
-            'enabled': 5,
-            'disabled': 0,
-        }
-
-        with patch('ui.dashboard.QMessageBox.information') as mock_msg:
-            dashboard._show_startup_info()
-
-            mock_msg.assert_called_once()
-
-    def test_cleanup(self, dashboard):
-        """Test cleanup method."""
-        # Start timers
-        dashboard.process_timer.start(1000)
-        dashboard.overview_timer.start(1000)
+            if check:
+                assert check in mock_msg.call_args[0][2]
 
-        # Cleanup
+    def test_cleanup(self, dashboard, dashboard_process_monitor):
+        """Test cleanup stops the process monitor worker."""
         dashboard.cleanup()
 
-        # Timers should be stopped
-        assert not dashboard.process_timer.isActive()
-        assert not dashboard.overview_timer.isActive()
+        dashboard_process_monitor.cleanup.assert_called_once_with()
@@ -2,190 +2,225 @@
 Tests for UI dialogs - ProcessDetailDialog and StartupDetailDialog
 """
 
-import sys
-from pathlib import Path
+from collections import namedtuple
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from ui.process_detail_dialog import ProcessDetailDialog
 from ui.startup_detail_dialog import StartupDetailDialog
 
 
-class TestProcessDetailDialog:
-    """Test ProcessDetailDialog class."""
-
-    @pytest.fixture
-    def process_data(self):
-        """Sample process data."""
-        return {
-            'pid': 123,
-            'name': 'Chrome',
-            'username': 'testuser',
-            'cpu_percent': 25.5,
-            'memory_percent': 10.2,
-            'memory_human': '500 MB',
-            'status': 'running',
-            'create_time': 1234567890.0,
-            'num_threads': 10,
-            'cmdline': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'],
+STARTUP_ITEM_TYPES = ('Login Item', 'Launch Agent', 'Launch Daemon')
+
+
+# Dialog inputs are read-only, so one frozen copy serves the whole session
+
+@pytest.fixture(scope="session")
+def process_data():
+    """Sample process data."""
+    return MappingProxyType({
+        'pid': 123,
+        'name': 'Chrome',
+        'username': 'testuser',
+        'cpu_percent': 25.5,
+        'memory_percent': 10.2,
+        'memory_human': '500 MB',
+        'status': 'running',
+        'create_time': 1234567890.0,
+        'num_threads': 10,
+        'cmdline': '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    })
+
+
+@pytest.fixture(scope="session")
+def minimal_process_data():
+    """Process data with only the required fields."""
+    return MappingProxyType({
+        'pid': 123,
+        'name': 'test_process',
+    })
+
+
+@pytest.fixture(scope="session")
+def startup_item_data():
+    """Sample startup item data."""
+    return MappingProxyType({
+        'name': 'Dropbox',
+        'type': 'Login Item',
+        'enabled': True,
+        'location': '/Applications/Dropbox.app',
+        'label': 'com.dropbox.app',
+    })
+
+
+@pytest.fixture(scope="session")
+def minimal_startup_data():
+    """Startup item data with only the required fields."""
+    return MappingProxyType({
+        'name': 'test_item',
+        'type': 'Login Item',
+    })
+
+
+DialogSetup = namedtuple('DialogSetup', [
+    'cls', 'data', 'minimal_data', 'data_attr', 'describer',
+])
+
+# Dialog class, data fixture, minimal data fixture, data attribute, describer symbol
+DIALOG_CASES = {
+    'process': (
+        ProcessDetailDialog, 'process_data', 'minimal_process_data',
+        'process_data', 'ui.process_detail_dialog.ProcessDescriber',
+    ),
+    'startup': (
+        StartupDetailDialog, 'startup_item_data', 'minimal_startup_data',
+        'startup_data', 'ui.startup_detail_dialog.StartupDescriber',
+    ),
+}
+
+
+@pytest.fixture(params=list(DIALOG_CASES.values()), ids=list(DIALOG_CASES))
+def dialog_setup(request, qapp):
+    """Dialog class and inputs for behaviour both detail dialogs share."""
+    cls, data_name, minimal_name, data_attr, describer_path = request.param
+    with patch(describer_path) as mock_describer:
+        mock_describer.get_description.return_value = "Test description"
+        mock_describer.is_known_process.return_value = True
+        mock_describer.is_recognized.return_value = True
+        mock_describer.get_recommendation.return_value = {
+            'should_enable': None,
+            'reason': "Test reason",
         }
+        yield DialogSetup(
+            cls=cls,
+            data=request.getfixturevalue(data_name),
+            minimal_data=request.getfixturevalue(minimal_name),
+            data_attr=data_attr,
+            describer=mock_describer,
+        )
 
-    def test_initialization(self, qapp, process_data):
-        """Test ProcessDetailDialog initialization."""
-        dialog = ProcessDetailDialog(process_data)
 
-        assert dialog.process_data == process_data
-        assert dialog.simple_mode == False
-        assert dialog.windowTitle() == "Process Details - Chrome"
+class TestDetailDialogCommon:
+    """Test behaviour shared by ProcessDetailDialog and StartupDetailDialog."""
 
-    def test_init_ui(self, qapp, process_data):
+    def test_init_ui(self, dialog_setup):
         """Test UI initialization."""
-        dialog = ProcessDetailDialog(process_data)
+        dialog = dialog_setup.cls(dialog_setup.data)
 
         # Should have content layout
         assert dialog.content_layout is not None
 
-    def test_create_header(self, qapp, process_data):
+    def test_create_header(self, dialog_setup):
         """Test header creation."""
-        dialog = ProcessDetailDialog(process_data)
+        dialog = dialog_setup.cls(dialog_setup.data)
 
         header = dialog._create_header()
 
         assert header is not None
 
-    def test_create_toggle_section(self, qapp, process_data):
-        """Test toggle section creation."""
-        dialog = ProcessDetailDialog(process_data)
+    def test_add_description_section(self, dialog_setup):
+        """Test description section."""
+        dialog = dialog_setup.cls(dialog_setup.data)
 
-        toggle_section = dialog._create_toggle_section()
+        # Should create section without error
+        dialog_setup.describer.get_description.assert_called()
+        assert dialog.content_layout is not None
 
-        assert toggle_section is not None
+    def test_add_recommendation_section(self, dialog_setup):
+        """Test recommendation section."""
+        dialog = dialog_setup.cls(dialog_setup.data)
 
-    def test_add_description_section(self, qapp, process_data):
-        """Test description section."""
-        with patch('ui.process_detail_dialog.ProcessDescriber') as mock_describer:
-            mock_describer.return_value.get_description.return_value = "Test description"
-            mock_describer.return_value.is_safe_to_quit.return_value = True
+        # Should create section without error
+        assert dialog.content_layout is not None
 
-            dialog = ProcessDetailDialog(process_data)
+    def test_minimal_data(self, dialog_setup):
+        """Test dialog with minimal input data."""
+        dialog = dialog_setup.cls(dialog_setup.minimal_data)
 
-            # Should create section without error
-            assert True
+        assert getattr(dialog, dialog_setup.data_attr) == dialog_setup.minimal_data
 
-    def test_add_recommendation_section(self, qapp, process_data):
-        """Test recommendation section."""
-        with patch('ui.process_detail_dialog.ProcessDescriber'):
-            dialog = ProcessDetailDialog(process_data)
 
-            # Should create section without error
-            assert True
+@pytest.fixture(scope="class")
+def _patch_describer():
+    """Patch ProcessDescriber once for the whole dialog test class."""
+    with patch('ui.process_detail_dialog.ProcessDescriber') as mock_describer:
+        mock_describer.get_description.return_value = "Test description"
+        mock_describer.is_known_process.return_value = True
+        yield mock_describer
 
-    def test_add_process_info_section(self, qapp, process_data):
-        """Test process info section."""
+
+@pytest.fixture(scope="class")
+def shared_dialog(qapp, _patch_describer, process_data):
+    """One ProcessDetailDialog shared by tests that do not mutate it."""
+    dialog = ProcessDetailDialog(process_data)
+    qapp.processEvents()
+    yield dialog
+
+    dialog.deleteLater()
+    qapp.processEvents()
+    qapp.sendPostedEvents(None, 0)
+
+
+@pytest.mark.usefixtures("_patch_describer")
+class TestProcessDetailDialog:
+    """Test ProcessDetailDialog class."""
+
+    def test_initialization(self, qapp, process_data):
+        """Test ProcessDetailDialog initialization."""
         dialog = ProcessDetailDialog(process_data)
 
+        assert dialog.process_data == process_data
+        assert dialog.simple_mode == False
+        assert dialog.windowTitle() == "Process Details - Chrome"
+
+    def test_create_toggle_section(self, shared_dialog):
+        """Test toggle section creation."""
+        toggle_section = shared_dialog._create_toggle_section()
+
+        assert toggle_section is not None
+
+    def test_add_process_info_section(self, shared_dialog):
+        """Test process info section."""
         # Should create section without error
-        assert True
+        assert shared_dialog.content_layout is not None
 
-    def test_add_resource_usage_section(self, qapp, process_data):
+    def test_add_resource_usage_section(self, shared_dialog):
         """Test resource usage section."""
-        dialog = ProcessDetailDialog(process_data)
-
         # Should create section without error
-        assert True
+        assert shared_dialog.content_layout is not None
 
-    def test_add_command_line_section(self, qapp, process_data):
+    def test_add_command_line_section(self, shared_dialog):
         """Test command line section."""
-        dialog = ProcessDetailDialog(process_data)
-
         # Should create section without error
-        assert True
+        assert shared_dialog.content_layout is not None
 
     def test_toggle_explanation_mode(self, qapp, process_data):
         """Test toggling explanation mode."""
-        with patch('ui.process_detail_dialog.ProcessDescriber'):
-            dialog = ProcessDetailDialog(process_data)
-
-            # Toggle mode
-            dialog._toggle_explanation_mode(True)
-
-            assert dialog.simple_mode == True
+        dialog = ProcessDetailDialog(process_data)
 
-            # Toggle back
-            dialog._toggle_explanation_mode(False)
+        # Toggle mode
+        dialog._toggle_explanation_mode(True)
 
-            assert dialog.simple_mode == False
+        assert dialog.simple_mode == True
 
-    def test_minimal_process_data(self, qapp):
-        """Test dialog with minimal process data."""
-        minimal_data = {
-            'pid': 123,
-            'name': 'test_process',
-        }
+        # Toggle back
+        dialog._toggle_explanation_mode(False)
 
-        dialog = ProcessDetailDialog(minimal_data)
-
-        assert dialog.process_data == minimal_data
+        assert dialog.simple_mode == False
 
 
 class TestStartupDetailDialog:
     """Test StartupDetailDialog class."""
 
-    @pytest.fixture
-    def startup_item_data(self):
-        """Sample startup item data."""
-        return {
-            'name': 'Dropbox',
-            'type': 'Login Item',
-            'enabled': True,
-            'location': '/Applications/Dropbox.app',
-            'label': 'com.dropbox.app',
-        }
-
     def test_initialization(self, qapp, startup_item_data):
         """Test StartupDetailDialog initialization."""
         dialog = StartupDetailDialog(startup_item_data)
 
-        assert dialog.item_data == startup_item_data
+        assert dialog.startup_data == startup_item_data
         assert dialog.windowTitle() == "Startup Item Details - Dropbox"
 
-    def test_init_ui(self, qapp, startup_item_data):
-        """Test UI initialization."""
-        dialog = StartupDetailDialog(startup_item_data)
-
-        # Should have content layout
-        assert dialog.content_layout is not None
-
-    def test_create_header(self, qapp, startup_item_data):
-        """Test header creation."""
-        dialog = StartupDetailDialog(startup_item_data)
-
-        header = dialog._create_header()
-
-        assert header is not None
-
-    def test_add_description_section(self, qapp, startup_item_data):
-        """Test description section."""
-        with patch('ui.startup_detail_dialog.StartupItemDescriber') as mock_describer:
-            mock_describer.return_value.get_description.return_value = "Test description"
-            mock_describer.return_value.is_safe_to_disable.return_value = True
-
-            dialog = StartupDetailDialog(startup_item_data)
-
-            # Should create section without error
-            assert True
-
-    def test_add_recommendation_section(self, qapp, startup_item_data):
-        """Test recommendation section."""
-        with patch('ui.startup_detail_dialog.StartupItemDescriber'):
-            dialog = StartupDetailDialog(startup_item_data)
-
-            # Should create section without error
-            assert True
-
     def test_add_item_info_section(self, qapp, startup_item_data):
         """Test item info section."""
         dialog = StartupDetailDialog(startup_item_data)
@@ -193,27 +228,14 @@ class TestStartupDetailDialog:
         # Should create section without error
         assert True
 
-    def test_minimal_startup_data(self, qapp):
-        """Test dialog with minimal startup data."""
-        minimal_data = {
-            'name': 'test_item',
-            'type': 'Login Item',
-        }
-
-        dialog = StartupDetailDialog(minimal_data)
-
-        assert dialog.item_data == minimal_data
-
-    def test_different_item_types(self, qapp):
+    @pytest.mark.parametrize("item_type", STARTUP_ITEM_TYPES)
+    def test_different_item_types(self, qapp, item_type):
         """Test dialog with different item types."""
-        types = ['Login Item', 'Launch Agent', 'Launch Daemon']
-
-        for item_type in types:
-            data = {
-                'name': 'test',
-                'type': item_type,
-            }
+        data = {
+            'name': 'test',
+            'type': item_type,
+        }
 
-            dialog = StartupDetailDialog(data)
+        dialog = StartupDetailDialog(data)
 
-            assert dialog.item_data['type'] == item_type
+        assert dialog.startup_data['type'] == item_type
@@ -2,17 +2,20 @@
 Tests for ui/fonts.py - Font management
 """
 
-import sys
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from PyQt6.QtGui import QFont
 
 from ui.fonts import FontManager, get_font_manager
 
 
+@pytest.fixture(scope="module")
+def font_manager(qapp):
+    """One FontManager shared by every test in the module."""
+    return FontManager()
+
+
 class TestFontManager:
     """Test FontManager class."""
 
@@ -30,9 +33,9 @@ class TestFontManager:
 
         assert manager1 is manager2
 
-    def test_load_fonts(self, qapp):
+    def test_load_fonts(self, font_manager):
         """Test load_fonts method."""
-        manager = FontManager()
+        manager = font_manager
 
         # Should run without error
         try:
@@ -41,66 +44,53 @@ class TestFontManager:
             # It's OK if fonts don't load in test environment
             pass
 
-    def test_get_display_font(self, qapp):
+    def test_get_display_font(self, font_manager):
         """Test get_display_font method."""
-        manager = FontManager()
+        manager = font_manager
 
         font = manager.get_display_font(size=14, weight=400)
 
-        from PyQt6.QtGui import QFont
         assert isinstance(font, QFont)
         assert font.pointSize() == 14
 
-    def test_get_mono_font(self, qapp):
+    def test_get_mono_font(self, font_manager):
         """Test get_mono_font method."""
-        manager = FontManager()
+        manager = font_manager
 
         font = manager.get_mono_font(size=12)
 
-        from PyQt6.QtGui import QFont
         assert isinstance(font, QFont)
         assert font.pointSize() == 12
 
-    def test_get_display_font_default_params(self, qapp):
+    def test_get_display_font_default_params(self, font_manager):
         """Test get_display_font with default parameters."""
-        manager = FontManager()
+        manager = font_manager
 
         font = manager.get_display_font()
 
-        from PyQt6.QtGui import QFont
         assert isinstance(font, QFont)
 
-    def test_get_mono_font_default_params(self, qapp):
+    def test_get_mono_font_default_params(self, font_manager):
         """Test get_mono_font with default parameters."""
-        manager = FontManager()
+        manager = font_manager
 
         font = manager.get_mono_font()
 
-        from PyQt6.QtGui import QFont
         assert isinstance(font, QFont)
 
-    def test_get_display_font_various_weights(self, qapp):
+    @pytest.mark.parametrize("weight", [300, 400, 700])
+    def test_get_display_font_various_weights(self, font_manager, weight):
         """Test get_display_font with various weights."""
-        manager = FontManager()
-
-        font_light = manager.get_display_font(weight=300)
-        font_normal = manager.get_display_font(weight=400)
-        font_bold = manager.get_display_font(weight=700)
+        font = font_manager.get_display_font(weight=weight)
 
-        from PyQt6.QtGui import QFont
-        assert all(isinstance(f, QFont) for f in [font_light, font_normal, font_bold])
+        assert isinstance(font, QFont)
 
-    def test_get_display_font_various_sizes(self, qapp):
+    @pytest.mark.parametrize("size", [10, 14, 24])
+    def test_get_display_font_various_sizes(self, font_manager, size):
         """Test get_display_font with various sizes."""
-        manager = FontManager()
-
-        font_small = manager.get_display_font(size=10)
-        font_medium = manager.get_display_font(size=14)
-        font_large = manager.get_display_font(size=24)
+        font = font_manager.get_display_font(size=size)
 
-        assert font_small.pointSize() == 10
-        assert font_medium.pointSize() == 14
-        assert font_large.pointSize() == 24
+        assert font.pointSize() == size
 
 
 class TestGetFontManager:
@@ -3,240 +3,236 @@ Tests for main.py - MainWindow class
 """
 
 import json
+import logging
 import sys
-from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from PyQt6.QtGui import QPalette
 
 from main import MainWindow, main
 
 
-class TestMainWindow:
-    """Test MainWindow class."""
+@pytest.fixture(scope="module")
+def main_managers(manager_specs):
+    """Manager mocks seeded with what MainWindow construction reads."""
+    from process_monitor import ProcessMonitor
+    from startup_manager import StartupManager
 
-    def test_initialization(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Test MainWindow initialization."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager') as mock_font_mgr:
+    startup_manager = Mock(spec=manager_specs[StartupManager])
+    startup_manager.get_all_items.return_value = []
+    startup_manager.get_summary.return_value = {'total': 0, 'enabled': 0, 'disabled': 0}
 
-            mock_font_mgr.return_value.load_fonts.return_value = None
+    process_monitor = Mock(spec=manager_specs[ProcessMonitor])
+    process_monitor.get_processes.return_value = []
+    return startup_manager, process_monitor
 
-            window = MainWindow()
 
-            assert window.startup_manager is not None
-            assert window.process_monitor is not None
-            assert window.dashboard is not None
-            assert window.windowTitle() == "Mac Health Analyzer"
-            assert window.minimumSize().width() == 1200
-            assert window.minimumSize().height() == 800
+@pytest.fixture(scope="module")
+def mock_get_font_manager():
+    """get_font_manager stand-in MainWindow loads its fonts through."""
+    return MagicMock()
 
-    def test_setup_window(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Test window setup."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager'):
 
-            window = MainWindow()
+@pytest.fixture(scope="module", autouse=True)
+def _patch_main(main_managers, mock_get_font_manager):
+    """Swap MainWindow's managers and font manager for mocks for the whole module."""
+    startup_manager, process_monitor = main_managers
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('main.StartupManager', lambda *args, **kwargs: startup_manager)
+        mp.setattr('main.ProcessMonitor', lambda *args, **kwargs: process_monitor)
+        mp.setattr('main.get_font_manager', mock_get_font_manager)
+        yield
 
-            assert window.windowTitle() == "Mac Health Analyzer"
-            assert window.minimumWidth() == 1200
-            assert window.minimumHeight() == 800
 
-    def test_center_on_screen(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Test window centering."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager'):
+@pytest.fixture(scope="session")
+def empty_home(tmp_path_factory):
+    """Home directory with no app config; tests must not write to it."""
+    return tmp_path_factory.mktemp('empty_home')
 
-            window = MainWindow()
-            window.center_on_screen()
 
-            # Window should be positioned (test that method runs without error)
-            assert window.geometry().x() >= 0
-            assert window.geometry().y() >= 0
+@pytest.fixture(scope="session")
+def seen_guide_home(tmp_path_factory):
+    """Home directory whose config records the startup guide as shown."""
+    root = tmp_path_factory.mktemp('seen_home')
+    config_dir = root / '.mac-health-analyzer'
+    config_dir.mkdir()
+    (config_dir / 'config.json').write_text(json.dumps({'startup_guide_shown': True}))
+    return root
 
-    def test_load_fonts_success(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Test successful font loading."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager') as mock_font_mgr:
 
-            mock_font_mgr.return_value.load_fonts.return_value = None
+@pytest.fixture(scope="class")
+def main_window(qapp, _patch_main):
+    """One MainWindow shared by the tests of a class."""
+    window = MainWindow()
+    yield window
+    window.deleteLater()
 
-            window = MainWindow()
-            window.load_fonts()
 
-            # Should complete without error
-            assert mock_font_mgr.called
+@pytest.fixture
+def config_window(main_window):
+    """Shared MainWindow with its cached config dropped around the test."""
+    main_window.__dict__.pop('_config', None)
+    yield main_window
+    main_window.__dict__.pop('_config', None)
 
-    def test_load_fonts_failure(self, qapp, mock_startup_manager, mock_process_monitor, capsys):
-        """Test font loading failure handling."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager') as mock_font_mgr:
 
-            mock_font_mgr.return_value.load_fonts.side_effect = Exception("Font error")
+class TestMainWindow:
+    """Test MainWindow class."""
 
-            window = MainWindow()
+    def test_initialization(self, main_window, main_managers):
+        """Test MainWindow initialization."""
+        assert (main_window.startup_manager, main_window.process_monitor) == main_managers
+        assert main_window.dashboard is not None
+        assert main_window.windowTitle() == "Mac Health Analyzer"
+        assert main_window.minimumSize().width() == 1200
+        assert main_window.minimumSize().height() == 800
 
-            # Should handle error gracefully
-            captured = capsys.readouterr()
-            assert "Could not load custom fonts" in captured.out or True  # Error is printed
+    def test_center_on_screen(self, main_window):
+        """Test window centering."""
+        main_window.center_on_screen()
 
-    def test_apply_styles(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Test applying styles."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager'), \
-             patch('main.get_palette') as mock_palette, \
-             patch('main.get_main_stylesheet') as mock_stylesheet:
+        # Offsets are negative when the screen is smaller than the window
+        screen = QApplication.primaryScreen().geometry()
+        geometry = main_window.geometry()
+        assert geometry.x() == (screen.width() - geometry.width()) // 2
+        assert geometry.y() == (screen.height() - geometry.height()) // 2
 
-            mock_palette.return_value = MagicMock()
-            mock_stylesheet.return_value = ""
+    def test_load_fonts_success(self, main_window, mock_get_font_manager):
+        """Test successful font loading."""
+        # Building the shared class window already loaded fonts through the patched manager
+        assert mock_get_font_manager.called
+        mock_get_font_manager.return_value.load_fonts.assert_called()
 
-            window = MainWindow()
+    def test_load_fonts_failure(self, main_window, caplog, monkeypatch):
+        """Test font loading failure handling."""
+        font_manager = MagicMock()
+        font_manager.load_fonts.side_effect = Exception("Font error")
+        monkeypatch.setattr('main.get_font_manager', lambda: font_manager)
 
-            assert mock_palette.called
-            assert mock_stylesheet.called
+        # Should handle error gracefully and log the fallback
+        with caplog.at_level(logging.WARNING, logger='main'):
+            main_window.load_fonts()
 
-    def test_close_event(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Test window close event."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager'):
+        assert "Could not load custom fonts" in caplog.text
 
-            window = MainWindow()
+    def test_apply_styles(self, main_window):
+        """Test applying styles."""
+        with patch('main.get_palette', return_value=QPalette()) as mock_palette, \
+             patch('main.get_main_stylesheet', return_value="") as mock_stylesheet:
 
-            # Mock the close event
-            event = MagicMock()
-            window.closeEvent(event)
+            main_window.apply_styles()
 
-            # Event should be accepted
-            event.accept.assert_called_once()
+            assert mock_palette.called
+            assert mock_stylesheet.called
 
-    def test_has_seen_guide_no_file(self, qapp, mock_startup_manager, mock_process_monitor, tmp_path, monkeypatch):
-        """Test _has_seen_guide when config file doesn't exist."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager'):
+    def test_close_event(self, main_window):
+        """Test window close event."""
+        # Mock the close event
+        event = MagicMock()
+        main_window.closeEvent(event)
 
-            # Set config path to non-existent file
-            monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+        # Event should be accepted
+        event.accept.assert_called_once()
 
-            window = MainWindow()
-            result = window._has_seen_guide()
+    def test_has_seen_guide_no_file(self, config_window, empty_home, monkeypatch):
+        """Test _has_seen_guide when config file doesn't exist."""
+        # Point the config path at a home without a config file
+        monkeypatch.setattr(config_window, '_config_home', empty_home)
+        result = config_window._has_seen_guide()
 
-            assert result == False
+        assert result == False
 
-    def test_has_seen_guide_with_file(self, qapp, mock_startup_manager, mock_process_monitor, tmp_path, monkeypatch):
+    def test_has_seen_guide_with_file(self, config_window, seen_guide_home, monkeypatch):
         """Test _has_seen_guide when config file exists."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager'):
-
-            # Create config file
-            config_dir = tmp_path / '.mac-health-analyzer'
-            config_dir.mkdir()
-            config_file = config_dir / 'config.json'
-            config_file.write_text(json.dumps({'startup_guide_shown': True}))
+        monkeypatch.setattr(config_window, '_config_home', seen_guide_home)
+        result = config_window._has_seen_guide()
 
-            monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+        assert result == True
 
-            window = MainWindow()
-            result = window._has_seen_guide()
+    def test_save_guide_preference(self, config_window, tmp_path, monkeypatch):
+        """Test _save_guide_preference."""
+        monkeypatch.setattr(config_window, '_config_home', tmp_path)
+        config_window._save_guide_preference()
 
-            assert result == True
+        # Check config was saved
+        config_file = tmp_path / '.mac-health-analyzer' / 'config.json'
+        assert config_file.exists()
 
-    def test_save_guide_preference(self, qapp, mock_startup_manager, mock_process_monitor, tmp_path, monkeypatch):
-        """Test _save_guide_preference."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager'):
+        config = json.loads(config_file.read_text())
+        assert config['startup_guide_shown'] == True
 
-            monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+    def test_has_seen_guide_after_save(self, config_window, tmp_path, monkeypatch):
+        """Test the cached config is refreshed once the preference is saved."""
+        monkeypatch.setattr(config_window, '_config_home', tmp_path)
 
-            window = MainWindow()
-            window._save_guide_preference()
+        assert config_window._has_seen_guide() == False
 
-            # Check config was saved
-            config_file = tmp_path / '.mac-health-analyzer' / 'config.json'
-            assert config_file.exists()
+        config_window._save_guide_preference()
 
-            with open(config_file) as f:
-                config = json.load(f)
-            assert config['startup_guide_shown'] == True
+        assert config_window._has_seen_guide() == True
 
-    def test_get_config_path(self, qapp, mock_startup_manager, mock_process_monitor, tmp_path, monkeypatch):
+    def test_get_config_path(self, main_window, empty_home, monkeypatch):
         """Test _get_config_path."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager'):
+        monkeypatch.setattr(main_window, '_config_home', empty_home)
 
-            monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+        config_path = main_window._get_config_path()
 
-            window = MainWindow()
-            config_path = window._get_config_path()
+        assert config_path.parent.name == '.mac-health-analyzer'
+        assert config_path.name == 'config.json'
 
-            assert config_path.parent.name == '.mac-health-analyzer'
-            assert config_path.name == 'config.json'
-
-    def test_show_startup_guide_first_time(self, qapp, mock_startup_manager, mock_process_monitor, tmp_path, monkeypatch):
+    def test_show_startup_guide_first_time(self, config_window, tmp_path, monkeypatch):
         """Test showing startup guide for first time."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager'), \
-             patch('main.StartupGuide') as mock_guide:
+        # Mock guide dialog
+        guide_instance = MagicMock()
+        guide_instance.should_show_again.return_value = False
+        mock_guide = Mock(return_value=guide_instance)
+        monkeypatch.setattr('main.StartupGuide', mock_guide)
 
-            monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+        monkeypatch.setattr(config_window, '_config_home', tmp_path)
+        config_window.show_startup_guide_if_needed()
 
-            # Mock guide dialog
-            guide_instance = MagicMock()
-            guide_instance.should_show_again.return_value = False
-            mock_guide.return_value = guide_instance
+        # Guide should be shown
+        mock_guide.assert_called_once()
+        guide_instance.exec.assert_called_once()
 
-            window = MainWindow()
-            window.show_startup_guide_if_needed()
+    def test_show_startup_guide_already_seen(self, config_window, seen_guide_home, monkeypatch):
+        """Test not showing startup guide when already seen."""
+        mock_guide = Mock()
+        monkeypatch.setattr('main.StartupGuide', mock_guide)
 
-            # Guide should be shown
-            mock_guide.assert_called_once()
-            guide_instance.exec.assert_called_once()
+        monkeypatch.setattr(config_window, '_config_home', seen_guide_home)
+        config_window.show_startup_guide_if_needed()
 
-    def test_show_startup_guide_already_seen(self, qapp, mock_startup_manager, mock_process_monitor, tmp_path, monkeypatch):
-        """Test not showing startup guide when already seen."""
-        with patch('main.StartupManager', return_value=mock_startup_manager), \
-             patch('main.ProcessMonitor', return_value=mock_process_monitor), \
-             patch('main.get_font_manager'), \
-             patch('main.StartupGuide') as mock_guide:
+        # Guide should NOT be shown
+        mock_guide.assert_not_called()
 
-            # Create config file with guide shown
-            config_dir = tmp_path / '.mac-health-analyzer'
-            config_dir.mkdir()
-            config_file = config_dir / 'config.json'
-            config_file.write_text(json.dumps({'startup_guide_shown': True}))
 
-            monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+@pytest.fixture
+def session_app(qapp, monkeypatch):
+    """Hand main() the session QApplication and restore its app-wide state."""
+    font = qapp.font()
+    names = (qapp.applicationName(), qapp.organizationName())
 
-            window = MainWindow()
-            window.show_startup_guide_if_needed()
+    # main() would otherwise construct a second QApplication
+    app_cls = MagicMock(return_value=qapp)
+    monkeypatch.setattr('main.QApplication', app_cls)
+    yield qapp
 
-            # Guide should NOT be shown
-            mock_guide.assert_not_called()
+    qapp.setFont(font)
+    qapp.setApplicationName(names[0])
+    qapp.setOrganizationName(names[1])
 
 
+@pytest.mark.usefixtures("session_app")
 class TestMain:
     """Test main() function."""
 
     def test_main_function_success(self, qapp, monkeypatch):
         """Test main function runs successfully."""
         with patch('main.MainWindow') as mock_window_class, \
-             patch('main.get_font_manager'), \
              patch.object(sys, 'exit') as mock_exit:
 
             # Mock window instance
@@ -246,7 +242,7 @@ class TestMain:
             # Mock app.exec() to return immediately
             monkeypatch.setattr(QApplication, 'exec', lambda self: 0)
 
-            # This will create a new QApplication or use existing
+            # main() reuses the session QApplication via session_app
             main()
 
             # Window should be shown
@@ -48,6 +48,22 @@ class TestProcessesTab:
         tab = ProcessesTab(mock_process_monitor)
         return tab
 
+    @pytest.fixture
+    def populated_tab(self, processes_tab):
+        """ProcessesTab with one Chrome row populated and selected."""
+        processes_tab.populate_table([
+            {
+                'pid': 100,
+                'name': 'Chrome',
+                'memory_human': '500 MB',
+                'memory_mb': 500,
+                'memory_percent': 10.0,
+                'cpu_percent': 25.0,
+            },
+        ])
+        processes_tab.table.selectRow(0)
+        return processes_tab
+
     def test_initialization(self, processes_tab, mock_process_monitor):
         """Test ProcessesTab initialization."""
         assert processes_tab.process_monitor == mock_process_monitor
@@ -94,25 +110,18 @@ class TestProcessesTab:
         # Should return early without updating
         assert processes_tab.is_updating == True
 
-    def test_update_metrics(self, processes_tab, mock_process_monitor):
-        """Test metric card updates."""
-        mock_process_monitor.get_system_summary.return_value = {
-            'process_count': 150,
-            'memory_percent': 75.0,
-            'cpu_percent': 85.0,
-        }
-
+    def test_update_metrics_smoke(self, processes_tab):
+        """Test metric card updates run without error."""
         processes_tab.update_metrics()
 
-        # Cards should be updated (we can't check exact values due to mocking,
-        # but method should run without error)
-        assert True
-
-    def test_get_status_from_percent(self, processes_tab):
+    @pytest.mark.parametrize("percent,expected", [
+        (30, "low"),
+        (60, "medium"),
+        (90, "high"),
+    ])
+    def test_get_status_from_percent(self, processes_tab, percent, expected):
         """Test status level calculation."""
-        assert processes_tab.get_status_from_percent(30) == "low"
-        assert processes_tab.get_status_from_percent(60) == "medium"
-        assert processes_tab.get_status_from_percent(90) == "high"
+        assert processes_tab.get_status_from_percent(percent) == expected
 
     def test_apply_filters(self, processes_tab):
         """Test filter application."""
@@ -162,17 +171,17 @@ class TestProcessesTab:
 
     def test_populate_table_limit(self, processes_tab):
         """Test table population with limit."""
-        # Create 150 processes
+        # One process past the 100-row cap is enough to exercise it
         processes = [
             {
                 'pid': i,
-                'name': f'Process {i}',
-                'memory_human': '100 MB',
-                'memory_mb': 100,
-                'memory_percent': 5.0,
-                'cpu_percent': 10.0,
+                'name': 'P',
+                'memory_human': '1',
+                'memory_mb': 1,
+                'memory_percent': 0.0,
+                'cpu_percent': 0.0,
             }
-            for i in range(150)
+            for i in range(101)
         ]
 
         processes_tab.populate_table(processes)
@@ -180,25 +189,31 @@ class TestProcessesTab:
         # Should be limited to 100
         assert processes_tab.table.rowCount() == 100
 
-    def test_on_search(self, processes_tab):
+    def test_on_search(self, processes_tab, monkeypatch):
         """Test search handler."""
-        with patch.object(processes_tab, 'apply_filters') as mock_apply:
-            processes_tab.on_search("test")
-            mock_apply.assert_called_once()
+        mock_apply = Mock()
+        monkeypatch.setattr(processes_tab, 'apply_filters', mock_apply)
+
+        processes_tab.on_search("test")
+        mock_apply.assert_called_once()
 
-    def test_on_refresh(self, processes_tab):
+    def test_on_refresh(self, processes_tab, monkeypatch):
         """Test refresh button handler."""
-        with patch.object(processes_tab, 'update_data') as mock_update:
-            processes_tab.on_refresh()
-            mock_update.assert_called_once()
+        mock_update = Mock()
+        monkeypatch.setattr(processes_tab, 'update_data', mock_update)
 
-    def test_on_system_toggle(self, processes_tab, mock_process_monitor):
+        processes_tab.on_refresh()
+        mock_update.assert_called_once()
+
+    def test_on_system_toggle(self, processes_tab, mock_process_monitor, monkeypatch):
         """Test system processes toggle."""
-        with patch.object(processes_tab, 'update_data') as mock_update:
-            processes_tab.on_system_toggle(Qt.CheckState.Checked.value)
+        mock_update = Mock()
+        monkeypatch.setattr(processes_tab, 'update_data', mock_update)
+
+        processes_tab.on_system_toggle(Qt.CheckState.Checked.value)
 
-            mock_process_monitor.set_include_system_processes.assert_called_with(True)
-            mock_update.assert_called_once()
+        mock_process_monitor.set_include_system_processes.assert_called_with(True)
+        mock_update.assert_called_once()
 
     def test_on_force_quit_no_selection(self, processes_tab, qapp):
         """Test force quit with no selection."""
@@ -208,72 +223,31 @@ class TestProcessesTab:
             mock_msg.assert_called_once()
             assert "No Selection" in mock_msg.call_args[0][1]
 
-    def test_on_force_quit_with_confirmation(self, processes_tab, mock_process_monitor, qapp):
-        """Test force quit with confirmation."""
-        # Populate table
-        processes = [
-            {
-                'pid': 100,
-                'name': 'Chrome',
-                'memory_human': '500 MB',
-                'memory_mb': 500,
-                'memory_percent': 10.0,
-                'cpu_percent': 25.0,
-            },
-        ]
-        processes_tab.populate_table(processes)
-
-        # Select first row
-        processes_tab.table.selectRow(0)
-
+    @pytest.mark.parametrize("answer,should_kill", [
+        (QMessageBox.StandardButton.Yes, True),
+        (QMessageBox.StandardButton.No, False),
+    ], ids=["confirmed", "cancelled"])
+    def test_on_force_quit(self, populated_tab, mock_process_monitor, qapp, monkeypatch,
+                           answer, should_kill):
+        """Test force quit kills the process only when confirmed."""
         mock_process_monitor.kill_process.return_value = True
+        mock_info = Mock()
+        monkeypatch.setattr(QMessageBox, 'warning', lambda *args, **kwargs: answer)
+        monkeypatch.setattr(QMessageBox, 'information', mock_info)
+        monkeypatch.setattr(populated_tab, 'on_refresh', Mock())
 
-        with patch.object(QMessageBox, 'warning', return_value=QMessageBox.StandardButton.Yes), \
-             patch.object(QMessageBox, 'information') as mock_info, \
-             patch.object(processes_tab, 'on_refresh'):
-
-            processes_tab.on_force_quit()
+        populated_tab.on_force_quit()
 
+        assert mock_process_monitor.kill_process.called == should_kill
+        if should_kill:
             # Should kill process and show success
             mock_process_monitor.kill_process.assert_called_with(100, force=True)
             mock_info.assert_called_once()
+        else:
+            mock_info.assert_not_called()
 
-    def test_on_force_quit_cancelled(self, processes_tab, qapp):
-        """Test force quit cancelled."""
-        # Populate table
-        processes = [
-            {
-                'pid': 100,
-                'name': 'Chrome',
-                'memory_human': '500 MB',
-                'memory_mb': 500,
-                'memory_percent': 10.0,
-                'cpu_percent': 25.0,
-            },
-        ]
-        processes_tab.populate_table(processes)
-        processes_tab.table.selectRow(0)
-
-        with patch.object(QMessageBox, 'warning', return_value=QMessageBox.StandardButton.No):
-            processes_tab.on_force_quit()
-
-            # Should not proceed
-
-    def test_on_process_double_clicked(self, processes_tab, mock_process_monitor):
+    def test_on_process_double_clicked(self, populated_tab, mock_process_monitor):
         """Test double-click on process."""
-        # Populate table
-        processes = [
-            {
-                'pid': 100,
-                'name': 'Chrome',
-                'memory_human': '500 MB',
-                'memory_mb': 500,
-                'memory_percent': 10.0,
-                'cpu_percent': 25.0,
-            },
-        ]
-        processes_tab.populate_table(processes)
-
         mock_process_monitor.get_process_details.return_value = {
             'username': 'testuser',
             'status': 'running',
@@ -284,30 +258,17 @@ class TestProcessesTab:
             dialog_instance = MagicMock()
             mock_dialog.return_value = dialog_instance
 
-            processes_tab.on_process_double_clicked(0, 0)
+            populated_tab.on_process_double_clicked(0, 0)
 
             mock_dialog.assert_called_once()
             dialog_instance.exec.assert_called_once()
 
-    def test_on_process_double_clicked_not_found(self, processes_tab, mock_process_monitor, qapp):
+    def test_on_process_double_clicked_not_found(self, populated_tab, mock_process_monitor, qapp):
         """Test double-click on process that no longer exists."""
-        # Populate table
-        processes = [
-            {
-                'pid': 100,
-                'name': 'Chrome',
-                'memory_human': '500 MB',
-                'memory_mb': 500,
-                'memory_percent': 10.0,
-                'cpu_percent': 25.0,
-            },
-        ]
-        processes_tab.populate_table(processes)
-
         mock_process_monitor.get_process_details.return_value = None
 
         with patch.object(QMessageBox, 'warning') as mock_warn:
-            processes_tab.on_process_double_clicked(0, 0)
+            populated_tab.on_process_double_clicked(0, 0)
 
             mock_warn.assert_called_once()
             assert "Process Not Found" in mock_warn.call_args[0][1]
@@ -7,12 +7,47 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from PyQt6.QtCore import QSignalBlocker, Qt
+from PyQt6.QtWidgets import QDialog
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from ui.startup_guide import StartupGuide
 
 
+@pytest.fixture(scope="class")
+def _shared_guide(qapp):
+    """One StartupGuide dialog built per test class."""
+    guide = StartupGuide()
+    yield guide
+    guide.deleteLater()
+
+
+@pytest.fixture
+def guide(_shared_guide):
+    """The shared StartupGuide reset to its first page with the opt-out cleared."""
+    guide = _shared_guide
+    guide.current_step = 0
+    guide.stacked_widget.setCurrentIndex(0)
+    guide.step_indicator.setText("Step 1 of 4")
+    guide.back_btn.setEnabled(False)
+    guide.next_btn.setText("Next")
+    with QSignalBlocker(guide.dont_show_checkbox):
+        guide.dont_show_checkbox.setChecked(False)
+    guide.dont_show_again = False
+    guide.setResult(0)
+    return guide
+
+
+def _assert_page(guide, step):
+    """Guide shows the given zero-based step with matching navigation buttons."""
+    assert guide.current_step == step
+    assert guide.stacked_widget.currentIndex() == step
+    assert guide.step_indicator.text() == f"Step {step + 1} of 4"
+    assert guide.back_btn.isEnabled() == (step > 0)
+    assert guide.next_btn.text() == ("Finish" if step == 3 else "Next")
+
+
 class TestStartupGuide:
     """Test StartupGuide dialog."""
 
@@ -22,63 +57,55 @@ class TestStartupGuide:
 
         assert guide.windowTitle() == "Welcome to Mac Health Analyzer"
         assert guide.dont_show_again == False
-
-    def test_init_ui(self, qapp):
-        """Test UI initialization."""
-        guide = StartupGuide()
-
-        # Should have content
         assert guide.layout() is not None
 
-    def test_create_page_content(self, qapp):
-        """Test page content creation."""
-        guide = StartupGuide()
-
-        # Should create pages without error
-        assert True
-
-    def test_on_dont_show_changed(self, qapp):
+    def test_on_checkbox_changed(self, guide):
         """Test don't show checkbox handler."""
-        guide = StartupGuide()
-
-        guide.on_dont_show_changed(2)  # Qt.Checked = 2
+        guide._on_checkbox_changed(Qt.CheckState.Checked.value)
 
         assert guide.dont_show_again == True
 
-        guide.on_dont_show_changed(0)  # Qt.Unchecked = 0
+        guide._on_checkbox_changed(Qt.CheckState.Unchecked.value)
 
         assert guide.dont_show_again == False
 
-    def test_should_show_again(self, qapp):
+    def test_should_show_again(self, guide):
         """Test should_show_again method."""
-        guide = StartupGuide()
-
         assert guide.should_show_again() == True
 
         guide.dont_show_again = True
 
         assert guide.should_show_again() == False
 
-    def test_next_page(self, qapp):
-        """Test navigating to next page."""
-        guide = StartupGuide()
+    def test_next_page(self, guide):
+        """Test navigating forward through every step."""
+        _assert_page(guide, 0)
 
-        # Should be able to navigate without error
-        if hasattr(guide, 'next_page'):
-            guide.next_page()
+        for step in range(1, 4):
+            guide._on_next()
+            _assert_page(guide, step)
 
-    def test_previous_page(self, qapp):
-        """Test navigating to previous page."""
-        guide = StartupGuide()
+    def test_previous_page(self, guide):
+        """Test navigating back to the first step."""
+        guide._on_next()
+        guide._on_next()
 
-        # Should be able to navigate without error
-        if hasattr(guide, 'previous_page'):
-            guide.previous_page()
+        guide._on_back()
+        _assert_page(guide, 1)
 
-    def test_on_get_started(self, qapp):
-        """Test get started button."""
-        guide = StartupGuide()
+        guide._on_back()
+        _assert_page(guide, 0)
+
+        # Back on the first step stays put
+        guide._on_back()
+        _assert_page(guide, 0)
+
+    def test_finish_accepts(self, guide):
+        """Test Next on the last step closes the dialog as accepted."""
+        for _ in range(3):
+            guide._on_next()
+
+        guide._on_next()
 
-        # Should close dialog
-        if hasattr(guide, 'on_get_started'):
-            guide.on_get_started()
+        assert guide.result() == QDialog.DialogCode.Accepted
+        _assert_page(guide, 3)
@@ -2,25 +2,75 @@
 Tests for ui/startup_tab.py - StartupTab class
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import Mock, patch
 
 import pytest
-from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
 from PyQt6.QtCore import Qt
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from ui.startup_tab import StartupTab
 
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+
+# Read-only sample items; copy with dict() wherever the tab stores them
+_DROPBOX = MappingProxyType({
+    'name': 'Dropbox',
+    'type': 'Login Item',
+    'enabled': True,
+    'location': '/Applications/Dropbox.app',
+})
+_SLACK = MappingProxyType({
+    'name': 'Slack',
+    'type': 'Launch Agent',
+    'enabled': False,
+    'label': 'com.slack.agent',
+    'location': '/Library/LaunchAgents/com.slack.agent.plist',
+})
+_SAMPLE_ITEMS = (_DROPBOX, _SLACK)
+
+
+@pytest.fixture(scope="module")
+def _shared_startup_tab(qapp, manager_specs):
+    """One StartupTab built per module; managers are swapped in per test."""
+    from process_monitor import ProcessMonitor
+    from startup_manager import StartupManager
+
+    tab = StartupTab(
+        Mock(spec=manager_specs[StartupManager]),
+        Mock(spec=manager_specs[ProcessMonitor]),
+    )
+    yield tab
+    tab.deleteLater()
+
+
+def _reset_tab(tab):
+    """Restore the mutable table, filter and button state of a shared tab."""
+    tab.search_bar.line_edit.clear()
+    tab.filter_combo.setCurrentText("All Items")
+    tab.table.clearSelection()
+    tab.table.setRowCount(0)
+    tab.current_items = []
+    tab.refresh_btn.setEnabled(True)
+    tab.refresh_btn.setText("Refresh")
+
+
+def _seed_one_row(tab, item):
+    """Put a single row carrying item in the table without populate_table."""
+    tab.table.insertRow(0)
+    name_item = QTableWidgetItem(item['name'])
+    name_item.setData(Qt.ItemDataRole.UserRole, item)
+    tab.table.setItem(0, 0, name_item)
+
 
 class TestStartupTab:
     """Test StartupTab class."""
 
     @pytest.fixture
-    def startup_tab(self, qapp, mock_startup_manager, mock_process_monitor):
-        """Create a StartupTab instance for testing."""
+    def startup_tab(self, _shared_startup_tab, mock_startup_manager, mock_process_monitor,
+                    monkeypatch):
+        """The shared StartupTab, reset and wired to this test's managers."""
         mock_process_monitor.get_processes.return_value = [
             {
                 'pid': 101,
@@ -35,29 +85,22 @@ class TestStartupTab:
                 'memory_percent': 1.1,
             },
         ]
-        mock_startup_manager.get_all_items.return_value = [
-            {
-                'name': 'Dropbox',
-                'type': 'Login Item',
-                'enabled': True,
-                'location': '/Applications/Dropbox.app',
-            },
-            {
-                'name': 'Slack',
-                'type': 'Launch Agent',
-                'enabled': False,
-                'label': 'com.slack.agent',
-                'location': '/Library/LaunchAgents/com.slack.agent.plist',
-            },
-        ]
+        mock_startup_manager.get_all_items.return_value = [dict(item) for item in _SAMPLE_ITEMS]
         mock_startup_manager.get_summary.return_value = {
             'total': 10,
             'enabled': 6,
             'disabled': 4,
         }
 
-        tab = StartupTab(mock_startup_manager, mock_process_monitor)
-        return tab
+        _reset_tab(_shared_startup_tab)
+        monkeypatch.setattr(_shared_startup_tab, 'startup_manager', mock_startup_manager)
+        monkeypatch.setattr(_shared_startup_tab, 'process_monitor', mock_process_monitor)
+        return _shared_startup_tab
+
+    @pytest.fixture
+    def patched_dialog(self, mocker):
+        """StartupDetailDialog replaced by a MagicMock for this test."""
+        return mocker.patch('ui.startup_tab.StartupDetailDialog')
 
     def test_initialization(self, startup_tab, mock_startup_manager):
         """Test StartupTab initialization."""
@@ -112,108 +155,25 @@ class TestStartupTab:
         assert startup_tab.enabled_label.text() == "10"
         assert startup_tab.disabled_label.text() == "5"
 
-    def test_apply_filters_all_items(self, startup_tab):
-        """Test filter application for all items."""
-        startup_tab.current_items = [
-            {
-                'name': 'Dropbox',
-                'type': 'Login Item',
-                'enabled': True,
-                'location': '/Applications/Dropbox.app',
-            },
-            {
-                'name': 'Slack',
-                'type': 'Launch Agent',
-                'enabled': False,
-                'label': 'com.slack.agent',
-                'location': '/Library/LaunchAgents/com.slack.agent.plist',
-            },
-        ]
-
-        startup_tab.filter_combo.setCurrentText("All Items")
-        startup_tab.apply_filters()
-
-        assert startup_tab.table.rowCount() == 2
-
-    def test_apply_filters_login_items_only(self, startup_tab):
-        """Test filter for login items only."""
-        startup_tab.current_items = [
-            {
-                'name': 'Dropbox',
-                'type': 'Login Item',
-                'enabled': True,
-                'location': '/Applications/Dropbox.app',
-            },
-            {
-                'name': 'Slack',
-                'type': 'Launch Agent',
-                'enabled': False,
-                'label': 'com.slack.agent',
-                'location': '/Library/LaunchAgents/com.slack.agent.plist',
-            },
-        ]
-
-        startup_tab.filter_combo.setCurrentText("Login Items")
-        startup_tab.apply_filters()
-
-        assert startup_tab.table.rowCount() == 1
-
-    def test_apply_filters_enabled_only(self, startup_tab):
-        """Test filter for enabled items only."""
-        startup_tab.current_items = [
-            {
-                'name': 'Dropbox',
-                'type': 'Login Item',
-                'enabled': True,
-                'location': '/Applications/Dropbox.app',
-            },
-            {
-                'name': 'Slack',
-                'type': 'Launch Agent',
-                'enabled': False,
-                'label': 'com.slack.agent',
-                'location': '/Library/LaunchAgents/com.slack.agent.plist',
-            },
-        ]
-
-        startup_tab.filter_combo.setCurrentText("Enabled Only")
-        startup_tab.apply_filters()
-
-        assert startup_tab.table.rowCount() == 1
-
-    def test_apply_filters_search(self, startup_tab):
-        """Test search filter."""
-        startup_tab.current_items = [
-            {
-                'name': 'Dropbox',
-                'type': 'Login Item',
-                'enabled': True,
-                'location': '/Applications/Dropbox.app',
-            },
-            {
-                'name': 'Slack',
-                'type': 'Launch Agent',
-                'enabled': False,
-                'label': 'com.slack.agent',
-                'location': '/Library/LaunchAgents/com.slack.agent.plist',
-            },
-        ]
-
-        startup_tab.search_bar.line_edit.setText("Dropbox")
+    @pytest.mark.parametrize("combo,search,expected", [
+        ("All Items", "", 2),
+        ("Login Items", "", 1),
+        ("Enabled Only", "", 1),
+        ("All Items", "Dropbox", 1),
+    ], ids=["all_items", "login_items_only", "enabled_only", "search"])
+    def test_apply_filters(self, startup_tab, combo, search, expected):
+        """Test filter and search application."""
+        startup_tab.current_items = [dict(item) for item in _SAMPLE_ITEMS]
+
+        startup_tab.filter_combo.setCurrentText(combo)
+        startup_tab.search_bar.line_edit.setText(search)
         startup_tab.apply_filters()
 
-        assert startup_tab.table.rowCount() == 1
+        assert startup_tab.table.rowCount() == expected
 
     def test_populate_table(self, startup_tab):
         """Test table population."""
-        items = [
-            {
-                'name': 'Dropbox',
-                'type': 'Login Item',
-                'enabled': True,
-                'location': '/Applications/Dropbox.app',
-            },
-        ]
+        items = [dict(_DROPBOX)]
 
         startup_tab.populate_table(items)
 
@@ -238,80 +198,52 @@ class TestStartupTab:
         assert not startup_tab.refresh_btn.isEnabled()
         assert startup_tab.refresh_btn.text() == "Refreshing..."
 
-    def test_on_disable_selected_no_selection(self, startup_tab, qapp):
+    def test_on_disable_selected_no_selection(self, startup_tab, qapp, mocker):
         """Test disable with no selection."""
-        with patch.object(QMessageBox, 'information') as mock_msg:
-            startup_tab.on_disable_selected()
+        mock_msg = mocker.patch.object(QMessageBox, 'information')
+
+        startup_tab.on_disable_selected()
 
-            mock_msg.assert_called_once()
-            assert "No Selection" in mock_msg.call_args[0][1]
+        mock_msg.assert_called_once()
+        assert "No Selection" in mock_msg.call_args[0][1]
 
-    def test_on_disable_selected_with_confirmation(self, startup_tab, mock_startup_manager, qapp):
+    def test_on_disable_selected_with_confirmation(self, startup_tab, mock_startup_manager, qapp,
+                                                   mocker):
         """Test disable with confirmation."""
-        # Populate table
-        items = [
-            {
-                'name': 'Dropbox',
-                'type': 'Login Item',
-                'enabled': True,
-                'location': '/Applications/Dropbox.app',
-            },
-        ]
-        startup_tab.populate_table(items)
+        _seed_one_row(startup_tab, dict(_DROPBOX))
         startup_tab.table.selectRow(0)
 
         mock_startup_manager.disable_item.return_value = True
+        mocker.patch.object(QMessageBox, 'question', return_value=QMessageBox.StandardButton.Yes)
+        mock_info = mocker.patch.object(QMessageBox, 'information')
+        mocker.patch.object(startup_tab, 'on_refresh')
 
-        with patch.object(QMessageBox, 'question', return_value=QMessageBox.StandardButton.Yes), \
-             patch.object(QMessageBox, 'information') as mock_info, \
-             patch.object(startup_tab, 'on_refresh'):
+        startup_tab.on_disable_selected()
 
-            startup_tab.on_disable_selected()
+        # Should disable item and show success
+        mock_startup_manager.disable_item.assert_called()
+        mock_info.assert_called_once()
 
-            # Should disable item and show success
-            mock_startup_manager.disable_item.assert_called()
-            mock_info.assert_called_once()
-
-    def test_on_disable_selected_cancelled(self, startup_tab, qapp):
+    def test_on_disable_selected_cancelled(self, startup_tab, mock_startup_manager, qapp, mocker):
         """Test disable cancelled."""
-        # Populate table
-        items = [
-            {
-                'name': 'Dropbox',
-                'type': 'Login Item',
-                'enabled': True,
-                'location': '/Applications/Dropbox.app',
-            },
-        ]
-        startup_tab.populate_table(items)
+        _seed_one_row(startup_tab, dict(_DROPBOX))
         startup_tab.table.selectRow(0)
 
-        with patch.object(QMessageBox, 'question', return_value=QMessageBox.StandardButton.No):
-            startup_tab.on_disable_selected()
+        mocker.patch.object(QMessageBox, 'question', return_value=QMessageBox.StandardButton.No)
 
-            # Should not proceed
+        startup_tab.on_disable_selected()
 
-    def test_on_item_double_clicked(self, startup_tab):
-        """Test double-click on item."""
-        # Populate table
-        items = [
-            {
-                'name': 'Dropbox',
-                'type': 'Login Item',
-                'enabled': True,
-                'location': '/Applications/Dropbox.app',
-            },
-        ]
-        startup_tab.populate_table(items)
+        # Should not proceed
+        mock_startup_manager.disable_item.assert_not_called()
 
-        with patch('ui.startup_tab.StartupDetailDialog') as mock_dialog:
-            dialog_instance = MagicMock()
-            mock_dialog.return_value = dialog_instance
+    def test_on_item_double_clicked(self, startup_tab, patched_dialog):
+        """Test double-click on item."""
+        _seed_one_row(startup_tab, dict(_DROPBOX))
 
-            startup_tab.on_item_double_clicked(0, 0)
+        startup_tab.on_item_double_clicked(0, 0)
 
-            mock_dialog.assert_called_once()
-            dialog_instance.exec.assert_called_once()
+        patched_dialog.assert_called_once()
+        patched_dialog.return_value.exec.assert_called_once()
 
     def test_on_item_double_clicked_no_data(self, startup_tab, qapp):
         """Test double-click on empty row."""
@@ -319,22 +251,13 @@ class TestStartupTab:
 
         # Should handle gracefully (no exception)
 
-    def test_on_item_double_clicked_error(self, startup_tab, qapp):
+    def test_on_item_double_clicked_error(self, startup_tab, qapp, mocker, patched_dialog):
         """Test double-click with error."""
-        # Populate table
-        items = [
-            {
-                'name': 'Dropbox',
-                'type': 'Login Item',
-                'enabled': True,
-                'location': '/Applications/Dropbox.app',
-            },
-        ]
-        startup_tab.populate_table(items)
+        _seed_one_row(startup_tab, dict(_DROPBOX))
 
-        with patch('ui.startup_tab.StartupDetailDialog', side_effect=Exception("Test error")), \
-             patch.object(QMessageBox, 'warning') as mock_warn:
+        patched_dialog.side_effect = Exception("Test error")
+        mock_warn = mocker.patch.object(QMessageBox, 'warning')
 
-            startup_tab.on_item_double_clicked(0, 0)
+        startup_tab.on_item_double_clicked(0, 0)
 
-            mock_warn.assert_called_once()
+        mock_warn.assert_called_once()
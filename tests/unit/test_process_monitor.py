@@ -7,13 +7,38 @@ Tests ProcessMonitor class with comprehensive coverage.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
-from process_monitor import ProcessMonitor
+from process_monitor import ProcessMonitor, ProcessWorker
+
+
+pytestmark = pytest.mark.unit
+
+
+# Ten synthetic processes with distinct memory and CPU values, shared read-only
+_TEN_PROCS = tuple(
+    {'pid': i, 'name': f'proc_{i}', 'memory_mb': 100 - i, 'cpu_percent': 10.0 * i}
+    for i in range(10)
+)
+
+# Three processes whose memory, CPU and name orderings all differ
+_THREE_PROCS = (
+    {'pid': 1, 'name': 'chrome', 'memory_mb': 100, 'cpu_percent': 5.0},
+    {'pid': 2, 'name': 'firefox', 'memory_mb': 500, 'cpu_percent': 25.0},
+    {'pid': 3, 'name': 'safari', 'memory_mb': 200, 'cpu_percent': 50.0},
+)
+
+
+@pytest.fixture
+def monitor():
+    """ProcessMonitor whose worker thread is stopped after the test."""
+    monitor = ProcessMonitor()
+    yield monitor
+    monitor.cleanup()
+
 
 
 class TestProcessMonitorInit:
     """Test ProcessMonitor initialization."""
 
-    @pytest.mark.unit
     def test_initialization(self):
         """Test that ProcessMonitor initializes with correct defaults."""
         monitor = ProcessMonitor()
@@ -27,7 +52,6 @@ class TestProcessMonitorInit:
 class TestSetIncludeSystemProcesses:
     """Test set_include_system_processes method."""
 
-    @pytest.mark.unit
     def test_set_to_true(self):
         """Test setting include_system_processes to True."""
         monitor = ProcessMonitor()
@@ -35,7 +59,6 @@ class TestSetIncludeSystemProcesses:
 
         assert monitor.include_system_processes is True
 
-    @pytest.mark.unit
     def test_set_to_false(self):
         """Test setting include_system_processes to False."""
         monitor = ProcessMonitor()
@@ -48,7 +71,6 @@ class TestSetIncludeSystemProcesses:
 class TestGetProcesses:
     """Test get_processes method."""
 
-    @pytest.mark.unit
     def test_returns_processes_list(self, mock_process_list):
         """Test that get_processes returns the processes list."""
         monitor = ProcessMonitor()
@@ -62,7 +84,6 @@ class TestGetProcesses:
 class TestGetProcessCount:
     """Test get_process_count method."""
 
-    @pytest.mark.unit
     def test_returns_correct_count(self, mock_process_list):
         """Test that get_process_count returns correct count."""
         monitor = ProcessMonitor()
@@ -72,7 +93,6 @@ class TestGetProcessCount:
 
         assert result == len(mock_process_list)
 
-    @pytest.mark.unit
     def test_empty_list(self):
         """Test count with empty process list."""
         monitor = ProcessMonitor()
@@ -84,7 +104,6 @@ class TestGetProcessCount:
 class TestGetMemoryInfo:
     """Test get_memory_info method."""
 
-    @pytest.mark.unit
     def test_returns_memory_info(self, mock_memory_info):
         """Test that get_memory_info returns memory information."""
         monitor = ProcessMonitor()
@@ -98,7 +117,6 @@ class TestGetMemoryInfo:
 class TestGetCpuInfo:
     """Test get_cpu_info method."""
 
-    @pytest.mark.unit
     def test_returns_cpu_info(self, mock_cpu_info):
         """Test that get_cpu_info returns CPU information."""
         monitor = ProcessMonitor()
@@ -109,132 +127,67 @@ class TestGetCpuInfo:
         assert result == mock_cpu_info
 
 
-class TestGetTopMemoryProcesses:
-    """Test get_top_memory_processes method."""
-
-    @pytest.mark.unit
-    def test_returns_top_n(self):
-        """Test that returns exactly N processes."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': i, 'name': f'proc_{i}', 'memory_mb': 100 - i, 'cpu_percent': 10.0}
-            for i in range(10)
-        ]
-
-        result = monitor.get_top_memory_processes(n=5)
-
-        assert len(result) == 5
-
-    @pytest.mark.unit
-    def test_sorted_by_memory(self):
-        """Test that processes are sorted by memory usage."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'low', 'memory_mb': 100, 'cpu_percent': 10.0},
-            {'pid': 2, 'name': 'high', 'memory_mb': 1000, 'cpu_percent': 20.0},
-            {'pid': 3, 'name': 'medium', 'memory_mb': 500, 'cpu_percent': 15.0},
-        ]
-
-        result = monitor.get_top_memory_processes(n=3)
-
-        assert result[0]['memory_mb'] == 1000
-        assert result[1]['memory_mb'] == 500
-        assert result[2]['memory_mb'] == 100
-
-    @pytest.mark.unit
-    def test_handles_fewer_than_n(self):
-        """Test when there are fewer processes than requested."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'proc1', 'memory_mb': 100, 'cpu_percent': 10.0},
-        ]
-
-        result = monitor.get_top_memory_processes(n=10)
-
-        assert len(result) == 1
-
-
-class TestGetTopCpuProcesses:
-    """Test get_top_cpu_processes method."""
-
-    @pytest.mark.unit
-    def test_returns_top_n(self):
-        """Test that returns exactly N processes."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': i, 'name': f'proc_{i}', 'cpu_percent': 10.0 * i, 'memory_mb': 100}
-            for i in range(10)
-        ]
+@pytest.mark.parametrize("method,key", [
+    ('get_top_memory_processes', 'memory_mb'),
+    ('get_top_cpu_processes', 'cpu_percent'),
+], ids=["memory", "cpu"])
+class TestGetTopProcessesByKey:
+    """Test get_top_memory_processes and get_top_cpu_processes methods."""
 
-        result = monitor.get_top_cpu_processes(n=5)
+    @pytest.mark.parametrize("n", [5, 20], ids=["top_n", "fewer_than_n"])
+    def test_returns_top_n_by_key(self, monitor, method, key, n):
+        """Test that at most N processes come back, highest value of key first."""
+        monitor._latest_data['processes'] = list(_TEN_PROCS)
 
-        assert len(result) == 5
+        result = getattr(monitor, method)(n=n)
 
-    @pytest.mark.unit
-    def test_sorted_by_cpu(self):
-        """Test that processes are sorted by CPU usage."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'low', 'cpu_percent': 10.0, 'memory_mb': 100},
-            {'pid': 2, 'name': 'high', 'cpu_percent': 90.0, 'memory_mb': 200},
-            {'pid': 3, 'name': 'medium', 'cpu_percent': 50.0, 'memory_mb': 150},
-        ]
+        expected = sorted((proc[key] for proc in _TEN_PROCS), reverse=True)[:n]
+        assert [proc[key] for proc in result] == expected
 
-        result = monitor.get_top_cpu_processes(n=3)
 
-        assert result[0]['cpu_percent'] == 90.0
-        assert result[1]['cpu_percent'] == 50.0
-        assert result[2]['cpu_percent'] == 10.0
+def _named_procs(*names):
+    """Process dicts with the given names and ascending memory and CPU."""
+    return tuple(
+        {'pid': pid, 'name': name, 'memory_mb': 100.0 * pid, 'cpu_percent': 10.0 * pid}
+        for pid, name in enumerate(names, start=1)
+    )
 
 
 class TestSearchProcesses:
     """Test search_processes method."""
 
-    @pytest.mark.unit
-    def test_case_insensitive_search(self):
-        """Test that search is case-insensitive."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'Google Chrome', 'memory_mb': 100, 'cpu_percent': 10.0},
-            {'pid': 2, 'name': 'Firefox', 'memory_mb': 200, 'cpu_percent': 20.0},
-        ]
-
-        result = monitor.search_processes('chrome')
-
-        assert len(result) == 1
-        assert result[0]['name'] == 'Google Chrome'
-
-    @pytest.mark.unit
-    def test_partial_match(self):
-        """Test that partial matches work."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'python3', 'memory_mb': 100, 'cpu_percent': 10.0},
-            {'pid': 2, 'name': 'python2', 'memory_mb': 200, 'cpu_percent': 20.0},
-            {'pid': 3, 'name': 'java', 'memory_mb': 300, 'cpu_percent': 30.0},
-        ]
+    @pytest.fixture
+    def monitor_with(self, request, monitor):
+        """Monitor seeded with the process dataset passed as the indirect parameter."""
+        monitor._latest_data['processes'] = list(request.param)
+        return monitor
 
-        result = monitor.search_processes('python')
+    @pytest.mark.parametrize("monitor_with,query,expected_names", [
+        (_named_procs('Google Chrome', 'Firefox'), 'chrome', ['Google Chrome']),
+        (_named_procs('python3', 'python2', 'java'), 'python', ['python3', 'python2']),
+        (_named_procs('chrome'), 'firefox', []),
+    ], ids=["case_insensitive", "partial_match", "no_matches"], indirect=["monitor_with"])
+    def test_search(self, monitor_with, query, expected_names):
+        """Test case-insensitive, partial-name search."""
+        result = monitor_with.search_processes(query)
 
-        assert len(result) == 2
+        assert [proc['name'] for proc in result] == expected_names
 
-    @pytest.mark.unit
-    def test_no_matches(self):
-        """Test when search returns no matches."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'chrome', 'memory_mb': 100, 'cpu_percent': 10.0},
-        ]
+    def test_search_follows_new_data(self, monitor):
+        """Test the search index is rebuilt when the worker delivers new processes."""
+        monitor._latest_data['processes'] = list(_named_procs('Safari'))
+        assert monitor.search_processes('safari')
 
-        result = monitor.search_processes('firefox')
+        monitor._on_stats_updated({**monitor._latest_data,
+                                   'processes': list(_named_procs('Slack'))})
 
-        assert result == []
+        assert monitor.search_processes('safari') == []
+        assert [proc['name'] for proc in monitor.search_processes('sl')] == ['Slack']
 
 
 class TestGetProcessByPid:
     """Test get_process_by_pid method."""
 
-    @pytest.mark.unit
     def test_finds_existing_process(self):
         """Test finding an existing process."""
         monitor = ProcessMonitor()
@@ -249,7 +202,6 @@ class TestGetProcessByPid:
         assert result['pid'] == 200
         assert result['name'] == 'proc2'
 
-    @pytest.mark.unit
     def test_returns_none_for_nonexistent(self):
         """Test returns None for non-existent PID."""
         monitor = ProcessMonitor()
@@ -265,7 +217,6 @@ class TestGetProcessByPid:
 class TestKillProcess:
     """Test kill_process method."""
 
-    @pytest.mark.unit
     @patch('process_monitor.kill_process')
     def test_calls_kill_process_function(self, mock_kill):
         """Test that method calls the kill_process function."""
@@ -277,7 +228,6 @@ class TestKillProcess:
         assert result is True
         mock_kill.assert_called_once_with(1234, False)
 
-    @pytest.mark.unit
     @patch('process_monitor.kill_process')
     def test_force_kill(self, mock_kill):
         """Test force kill."""
@@ -292,7 +242,6 @@ class TestKillProcess:
 class TestGetMemoryUsagePercentage:
     """Test get_memory_usage_percentage method."""
 
-    @pytest.mark.unit
     def test_returns_correct_percentage(self):
         """Test returns correct memory percentage."""
         monitor = ProcessMonitor()
@@ -302,7 +251,6 @@ class TestGetMemoryUsagePercentage:
 
         assert result == 75.5
 
-    @pytest.mark.unit
     def test_returns_zero_when_missing(self):
         """Test returns 0.0 when percent is missing."""
         monitor = ProcessMonitor()
@@ -316,7 +264,6 @@ class TestGetMemoryUsagePercentage:
 class TestGetCpuUsagePercentage:
     """Test get_cpu_usage_percentage method."""
 
-    @pytest.mark.unit
     def test_returns_correct_percentage(self):
         """Test returns correct CPU percentage."""
         monitor = ProcessMonitor()
@@ -326,7 +273,6 @@ class TestGetCpuUsagePercentage:
 
         assert result == 42.5
 
-    @pytest.mark.unit
     def test_returns_zero_when_missing(self):
         """Test returns 0.0 when percent is missing."""
         monitor = ProcessMonitor()
@@ -340,7 +286,6 @@ class TestGetCpuUsagePercentage:
 class TestGetSystemSummary:
     """Test get_system_summary method."""
 
-    @pytest.mark.unit
     def test_returns_complete_summary(self):
         """Test that summary contains all expected keys."""
         monitor = ProcessMonitor()
@@ -367,112 +312,43 @@ class TestGetSystemSummary:
         assert result['cpu_count_logical'] == 16
 
 
-class TestSortProcesses:
-    """Test sort_processes method."""
-
-    @pytest.mark.unit
-    def test_sort_by_memory(self):
-        """Test sorting by memory."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'proc1', 'memory_mb': 100, 'cpu_percent': 10.0},
-            {'pid': 2, 'name': 'proc2', 'memory_mb': 500, 'cpu_percent': 20.0},
-            {'pid': 3, 'name': 'proc3', 'memory_mb': 200, 'cpu_percent': 15.0},
-        ]
-
-        result = monitor.sort_processes('memory_mb', reverse=True)
-
-        assert result[0]['memory_mb'] == 500
-        assert result[1]['memory_mb'] == 200
-        assert result[2]['memory_mb'] == 100
-
-    @pytest.mark.unit
-    def test_sort_by_name(self):
-        """Test sorting by name."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'chrome', 'memory_mb': 100, 'cpu_percent': 10.0},
-            {'pid': 2, 'name': 'firefox', 'memory_mb': 200, 'cpu_percent': 20.0},
-            {'pid': 3, 'name': 'safari', 'memory_mb': 150, 'cpu_percent': 15.0},
-        ]
-
-        result = monitor.sort_processes('name', reverse=False)
-
-        assert result[0]['name'] == 'chrome'
-        assert result[1]['name'] == 'firefox'
-        assert result[2]['name'] == 'safari'
-
-    @pytest.mark.unit
-    def test_invalid_key_defaults_to_memory(self):
-        """Test that invalid key defaults to memory_mb."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'proc1', 'memory_mb': 100, 'cpu_percent': 10.0},
-            {'pid': 2, 'name': 'proc2', 'memory_mb': 500, 'cpu_percent': 20.0},
-        ]
-
-        result = monitor.sort_processes('invalid_key')
-
-        assert result[0]['memory_mb'] == 500
-
-
-class TestFilterByMemoryThreshold:
-    """Test filter_by_memory_threshold method."""
-
-    @pytest.mark.unit
-    def test_filters_correctly(self):
-        """Test filtering by memory threshold."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'proc1', 'memory_mb': 50, 'cpu_percent': 10.0},
-            {'pid': 2, 'name': 'proc2', 'memory_mb': 150, 'cpu_percent': 20.0},
-            {'pid': 3, 'name': 'proc3', 'memory_mb': 300, 'cpu_percent': 30.0},
-        ]
-
-        result = monitor.filter_by_memory_threshold(100)
-
-        assert len(result) == 2
-        assert all(p['memory_mb'] >= 100 for p in result)
-
-    @pytest.mark.unit
-    def test_no_matches(self):
-        """Test when no processes meet threshold."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'proc1', 'memory_mb': 50, 'cpu_percent': 10.0},
-        ]
-
-        result = monitor.filter_by_memory_threshold(100)
-
-        assert result == []
-
-
-class TestFilterByCpuThreshold:
-    """Test filter_by_cpu_threshold method."""
-
-    @pytest.mark.unit
-    def test_filters_correctly(self):
-        """Test filtering by CPU threshold."""
-        monitor = ProcessMonitor()
-        monitor.processes = [
-            {'pid': 1, 'name': 'proc1', 'memory_mb': 100, 'cpu_percent': 5.0},
-            {'pid': 2, 'name': 'proc2', 'memory_mb': 200, 'cpu_percent': 25.0},
-            {'pid': 3, 'name': 'proc3', 'memory_mb': 300, 'cpu_percent': 50.0},
-        ]
-
-        result = monitor.filter_by_cpu_threshold(20.0)
-
-        assert len(result) == 2
-        assert all(p['cpu_percent'] >= 20.0 for p in result)
+class TestOrderingAndFilters:
+    """Test the sorting, top-N and threshold filter methods on one dataset."""
+
+    @pytest.mark.parametrize("method,kwargs,expected_pids", [
+        ('sort_processes', {'key': 'memory_mb', 'reverse': True}, [2, 3, 1]),
+        ('sort_processes', {'key': 'name', 'reverse': False}, [1, 2, 3]),
+        ('sort_processes', {'key': 'invalid_key'}, [2, 3, 1]),
+        ('get_top_memory_processes', {'n': 3}, [2, 3, 1]),
+        ('get_top_cpu_processes', {'n': 3}, [3, 2, 1]),
+        ('filter_by_memory_threshold', {'threshold_mb': 150}, [2, 3]),
+        ('filter_by_memory_threshold', {'threshold_mb': 1000}, []),
+        ('filter_by_cpu_threshold', {'threshold_percent': 20.0}, [2, 3]),
+    ], ids=[
+        "sort_memory_desc",
+        "sort_name_asc",
+        "sort_invalid_key_defaults_to_memory",
+        "top_memory",
+        "top_cpu",
+        "filter_memory",
+        "filter_memory_no_matches",
+        "filter_cpu",
+    ])
+    def test_ordering(self, monitor, method, kwargs, expected_pids):
+        """Test which processes each method returns, and in what order."""
+        monitor._latest_data['processes'] = list(_THREE_PROCS)
+
+        result = getattr(monitor, method)(**kwargs)
+
+        assert [proc['pid'] for proc in result] == expected_pids
 
 
 class TestGetProcessDetails:
     """Test get_process_details method."""
 
-    @pytest.mark.unit
-    @patch('process_monitor.psutil.Process')
-    def test_returns_detailed_info(self, mock_process_class):
-        """Test returns detailed process information."""
+    @pytest.fixture
+    def mock_psutil_process(self):
+        """psutil.Process stand-in wired with a full set of process details."""
         mock_proc = MagicMock()
         mock_proc.pid = 1234
         mock_proc.name.return_value = 'test_process'
@@ -483,10 +359,13 @@ class TestGetProcessDetails:
         mock_proc.memory_info.return_value = MagicMock()
         mock_proc.num_threads.return_value = 4
         mock_proc.cmdline.return_value = ['/usr/bin/test', '--arg']
+        return mock_proc
 
-        mock_process_class.return_value = mock_proc
+    @patch('process_monitor.psutil.Process')
+    def test_returns_detailed_info(self, mock_process_class, mock_psutil_process, monitor):
+        """Test returns detailed process information."""
+        mock_process_class.return_value = mock_psutil_process
 
-        monitor = ProcessMonitor()
         result = monitor.get_process_details(1234)
 
         assert result is not None
@@ -497,26 +376,78 @@ class TestGetProcessDetails:
         assert result['num_threads'] == 4
         assert result['cmdline'] == '/usr/bin/test --arg'
 
-    @pytest.mark.unit
     @patch('process_monitor.psutil.Process')
-    def test_handles_no_such_process(self, mock_process_class):
+    def test_handles_no_such_process(self, mock_process_class, monitor):
         """Test handling of non-existent process."""
         import psutil
         mock_process_class.side_effect = psutil.NoSuchProcess(9999)
 
-        monitor = ProcessMonitor()
         result = monitor.get_process_details(9999)
 
         assert result is None
 
-    @pytest.mark.unit
     @patch('process_monitor.psutil.Process')
-    def test_handles_access_denied(self, mock_process_class):
+    def test_handles_access_denied(self, mock_process_class, monitor):
         """Test handling of access denied."""
         import psutil
         mock_process_class.side_effect = psutil.AccessDenied()
 
-        monitor = ProcessMonitor()
         result = monitor.get_process_details(1)
 
         assert result is None
+
+
+class TestProcessWorkerSystemFilter:
+    """Test system process filtering in ProcessWorker._collect_metrics."""
+
+    @pytest.fixture
+    def owners(self):
+        """PID -> username table the fake processes report; tests may edit it."""
+        return {1: 'alice', 2: 'root', 3: 'nobody'}
+
+    @pytest.fixture
+    def worker(self, monkeypatch, owners):
+        """Unstarted worker reading its processes from the owners table."""
+        def make_process(pid):
+            proc = MagicMock()
+            proc.name.return_value = f'proc_{pid}'
+            proc.username.side_effect = lambda: owners[pid]
+            proc.memory_info.return_value.rss = 1024 * 1024
+            proc.cpu_percent.return_value = 0.0
+            return proc
+
+        monkeypatch.setattr('process_monitor.get_system_memory_info',
+                            lambda: {'total': 1024 * 1024 * 1024})
+        monkeypatch.setattr('process_monitor.get_cpu_info', lambda: {})
+        monkeypatch.setattr('process_monitor.psutil.pids', lambda: list(owners))
+        monkeypatch.setattr('process_monitor.psutil.Process', make_process)
+        return ProcessWorker()
+
+    @staticmethod
+    def _collected_pids(worker):
+        """Run one collection pass and return the PIDs it emitted."""
+        emitted = []
+        worker.stats_updated.connect(emitted.append)
+        try:
+            worker._collect_metrics()
+        finally:
+            worker.stats_updated.disconnect(emitted.append)
+        return [proc['pid'] for proc in emitted[0]['processes']]
+
+    @pytest.mark.parametrize("include_system,expected_pids", [
+        (False, [1]),
+        (True, [1, 2, 3]),
+    ], ids=["hidden", "included"])
+    def test_include_system(self, worker, include_system, expected_pids):
+        """Test system-owned processes are only emitted when requested."""
+        worker.set_include_system_processes(include_system)
+
+        assert self._collected_pids(worker) == expected_pids
+
+    def test_owner_rechecked_each_pass(self, worker, owners):
+        """Test a hidden PID is shown once it is reused by, or drops to, a user."""
+        assert self._collected_pids(worker) == [1]
+
+        owners[2] = 'bob'
+
+        assert self._collected_pids(worker) == [1, 2]
@@ -2,29 +2,26 @@
 Tests for utils/startup_descriptions.py
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from utils.startup_descriptions import StartupDescriber
 
 
+@pytest.fixture(scope="module")
+def describer():
+    """One StartupDescriber shared by every test in the module."""
+    return StartupDescriber()
+
+
 class TestStartupDescriber:
     """Test StartupDescriber class."""
 
-    def test_initialization(self):
+    def test_initialization(self, describer):
         """Test StartupDescriber initialization."""
-        describer = StartupDescriber()
-
         assert describer is not None
 
-    def test_get_description(self):
+    def test_get_description(self, describer):
         """Test get_description method."""
-        describer = StartupDescriber()
-
         # Test common startup items
         desc = describer.get_description("Dropbox")
         assert isinstance(desc, str)
@@ -36,10 +33,8 @@ class TestStartupDescriber:
         desc = describer.get_description("unknown_startup_item_xyz")
         assert isinstance(desc, str)
 
-    def test_is_safe_to_disable(self):
+    def test_is_safe_to_disable(self, describer):
         """Test is_safe_to_disable method."""
-        describer = StartupDescriber()
-
         # Apple system services should not be safe to disable
         result = describer.is_safe_to_disable("com.apple.notificationcenterui")
         assert isinstance(result, bool)
@@ -52,10 +47,8 @@ class TestStartupDescriber:
         result = describer.is_safe_to_disable("unknown_item")
         assert isinstance(result, bool)
 
-    def test_get_recommendation(self):
+    def test_get_recommendation(self, describer):
         """Test get_recommendation method."""
-        describer = StartupDescriber()
-
         rec = describer.get_recommendation("Dropbox", item_type="Login Item")
         assert isinstance(rec, str)
         assert len(rec) > 0
@@ -63,76 +56,53 @@ class TestStartupDescriber:
         rec = describer.get_recommendation("com.apple.mDNSResponder", item_type="Launch Daemon")
         assert isinstance(rec, str)
 
-    def test_get_simple_explanation(self):
+    def test_get_simple_explanation(self, describer):
         """Test get_simple_explanation method."""
-        describer = StartupDescriber()
-
         exp = describer.get_simple_explanation("Dropbox")
         assert isinstance(exp, str)
         assert len(exp) > 0
 
-    def test_get_technical_explanation(self):
+    def test_get_technical_explanation(self, describer):
         """Test get_technical_explanation method."""
-        describer = StartupDescriber()
-
         exp = describer.get_technical_explanation("com.apple.notificationcenterui")
         assert isinstance(exp, str)
         assert len(exp) > 0
 
-    def test_case_insensitive_matching(self):
+    @pytest.mark.parametrize("name", ["dropbox", "Dropbox", "DROPBOX"])
+    def test_case_insensitive_matching(self, describer, name):
         """Test that item name matching is case-insensitive."""
-        describer = StartupDescriber()
-
-        desc1 = describer.get_description("dropbox")
-        desc2 = describer.get_description("Dropbox")
-        desc3 = describer.get_description("DROPBOX")
-
         # Should all return descriptions
-        assert all(isinstance(d, str) for d in [desc1, desc2, desc3])
+        assert isinstance(describer.get_description(name), str)
 
-    def test_get_category(self):
+    def test_get_category(self, describer):
         """Test get_category method if it exists."""
-        describer = StartupDescriber()
-
         if hasattr(describer, 'get_category'):
             category = describer.get_category("Dropbox")
             assert isinstance(category, str)
 
-    def test_different_item_types(self):
+    @pytest.mark.parametrize("item_type", ["Login Item", "Launch Agent", "Launch Daemon"])
+    def test_different_item_types(self, describer, item_type):
         """Test with different item types."""
-        describer = StartupDescriber()
-
-        item_types = ["Login Item", "Launch Agent", "Launch Daemon"]
-
-        for item_type in item_types:
-            rec = describer.get_recommendation("test_item", item_type=item_type)
-            assert isinstance(rec, str)
+        rec = describer.get_recommendation("test_item", item_type=item_type)
+        assert isinstance(rec, str)
 
-    def test_multiple_items(self):
+    @pytest.mark.parametrize("item", [
+        "Dropbox",
+        "Slack",
+        "com.apple.notificationcenterui",
+        "com.google.keystone.agent",
+        "unknown_item_xyz",
+    ])
+    def test_multiple_items(self, describer, item):
         """Test describing multiple different startup items."""
-        describer = StartupDescriber()
-
-        items = [
-            "Dropbox",
-            "Slack",
-            "com.apple.notificationcenterui",
-            "com.google.keystone.agent",
-            "unknown_item_xyz"
-        ]
-
-        for item in items:
-            desc = describer.get_description(item)
-            assert isinstance(desc, str)
-            assert len(desc) > 0
-
-    def test_apple_vs_third_party(self):
-        """Test distinguishing between Apple and third-party items."""
-        describer = StartupDescriber()
-
-        # Apple items (usually start with com.apple)
-        apple_desc = describer.get_description("com.apple.notificationcenterui")
-        assert isinstance(apple_desc, str)
-
-        # Third-party items
-        third_party_desc = describer.get_description("Dropbox")
-        assert isinstance(third_party_desc, str)
+        desc = describer.get_description(item)
+        assert isinstance(desc, str)
+        assert len(desc) > 0
+
+    @pytest.mark.parametrize("name", [
+        "com.apple.notificationcenterui",  # Apple items (usually start with com.apple)
+        "Dropbox",  # Third-party items
+    ], ids=["apple", "third_party"])
+    def test_apple_vs_third_party(self, describer, name):
+        """Test describing both Apple and third-party items."""
+        assert isinstance(describer.get_description(name), str)
@@ -52,12 +52,13 @@ class TestRefresh:
         assert result == manager.all_items
 
     @pytest.mark.unit
-    @patch('startup_manager.time.time')
+    @patch('startup_manager.time.monotonic')
     @patch('startup_manager.fetch_launchctl_status')
     @patch('startup_manager.get_launch_daemons')
     @patch('startup_manager.get_launch_agents')
     @patch('startup_manager.get_login_items')
-    def test_launchctl_cache_refresh(self, mock_login, mock_agents, mock_daemons, mock_fetch, mock_time):
+    def test_launchctl_cache_refresh(self, mock_login, mock_agents, mock_daemons, mock_fetch, mock_time,
+                                     qapp):
         """Test that launchctl cache is refreshed after 5 seconds."""
         mock_fetch.return_value = {'com.test.service'}
         mock_login.return_value = []
@@ -67,17 +68,24 @@ class TestRefresh:
         # First call at time 0
         mock_time.return_value = 0.0
         manager = StartupManager()
-        manager.refresh()
+
+        def refresh_and_wait():
+            # The scan runs on the thread pool; deliver its queued result
+            manager.refresh()
+            manager._thread_pool.waitForDone()
+            qapp.processEvents()
+
+        refresh_and_wait()
         assert mock_fetch.call_count == 1
 
         # Second call at time 3 (within cache window)
         mock_time.return_value = 3.0
-        manager.refresh()
+        refresh_and_wait()
         assert mock_fetch.call_count == 1  # Should use cache
 
         # Third call at time 6 (beyond cache window)
         mock_time.return_value = 6.0
-        manager.refresh()
+        refresh_and_wait()
         assert mock_fetch.call_count == 2  # Should refresh cache
 
     @pytest.mark.unit
@@ -99,6 +107,16 @@ class TestRefresh:
         mock_agents.assert_called_once_with(loaded_labels=test_cache)
         mock_daemons.assert_called_once_with(loaded_labels=test_cache)
 
+    @pytest.mark.unit
+    def test_launchctl_cache_freshness(self):
+        """Test that the launchctl cache expires after 5 seconds."""
+        manager = StartupManager()
+        manager._launchctl_cache_ts = 10.0
+
+        assert manager._is_launchctl_cache_fresh(12.0) is True
+        assert manager._is_launchctl_cache_fresh(15.0) is True
+        assert manager._is_launchctl_cache_fresh(15.5) is False
+
 
 class TestGetAllItems:
     """Test get_all_items method."""
@@ -192,6 +210,37 @@ class TestGetEnabledItems:
         assert len(result) == 1
         assert result[0]['name'] == 'Item1'
 
+    @pytest.mark.unit
+    def test_reflects_replaced_items(self):
+        """Test that cached buckets are rebuilt when all_items is replaced."""
+        manager = StartupManager()
+        manager.all_items = [{'name': 'Item1', 'enabled': True}]
+        assert len(manager.get_enabled_items()) == 1
+
+        manager.all_items = [{'name': 'Item2', 'enabled': False}]
+
+        assert manager.get_enabled_items() == []
+        assert manager.get_disabled_items() == manager.all_items
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("getter,args", [
+        ('get_enabled_items', ()),
+        ('get_disabled_items', ()),
+        ('filter_by_type', ('Login Item',)),
+    ])
+    def test_returns_copy_of_cached_bucket(self, getter, args):
+        """Test that mutating a returned list leaves the cached bucket intact."""
+        manager = StartupManager()
+        manager.all_items = [
+            {'name': 'Item1', 'type': 'Login Item', 'enabled': True},
+            {'name': 'Item2', 'type': 'Login Item', 'enabled': False},
+        ]
+        expected = [item['name'] for item in getattr(manager, getter)(*args)]
+
+        getattr(manager, getter)(*args).append({'name': 'Intruder'})
+
+        assert [item['name'] for item in getattr(manager, getter)(*args)] == expected
+
 
 class TestGetDisabledItems:
     """Test get_disabled_items method."""
@@ -527,3 +576,21 @@ class TestGetSummary:
         assert result['login_items'] == 0
         assert result['launch_agents'] == 0
         assert result['launch_daemons'] == 0
+
+    @pytest.mark.unit
+    def test_counts_without_copying_buckets(self):
+        """Test that summary counts don't go through the copying getters."""
+        manager = StartupManager()
+        manager.all_items = [
+            {'name': 'Item1', 'enabled': True},
+            {'name': 'Item2', 'enabled': False},
+        ]
+
+        with patch.object(manager, 'get_enabled_items') as mock_enabled, \
+             patch.object(manager, 'get_disabled_items') as mock_disabled:
+            result = manager.get_summary()
+            assert (manager.get_enabled_count(), manager.get_disabled_count()) == (1, 1)
+
+        assert (result['enabled'], result['disabled']) == (1, 1)
+        mock_enabled.assert_not_called()
+        mock_disabled.assert_not_called()